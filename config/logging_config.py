@@ -2,17 +2,23 @@
 
 import json
 import logging
-from datetime import datetime, timezone
+import time
 from typing import Any, Dict
 
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for Uvicorn logs."""
 
+    @staticmethod
+    def _utc_timestamp(created: float) -> str:
+        """Format a record time as ISO-8601 UTC with microseconds, in one strftime."""
+        micros = int((created % 1) * 1_000_000)
+        return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(created))}.{micros:06d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_entry: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": self._utc_timestamp(record.created),
             "level": record.levelname,
             "logger": "pulse.uvicorn",
             "message": record.getMessage(),
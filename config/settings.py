@@ -47,12 +47,18 @@ class Settings(BaseSettings):
         # For stage/prod: use real env vars from ECS/SSM
         env_file=None,
         extra='ignore',  # Ignore extra fields not defined in the model
+        frozen=True,  # get_settings() hands one cached instance to every caller
     )
 
 
 @lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance. Call this instead of instantiating Settings directly."""
+    """Get cached settings instance. Call this instead of instantiating Settings directly.
+
+    The environment is parsed once per process; later calls return the same
+    frozen instance. Code that changes env vars (e.g. tests) must call
+    ``get_settings.cache_clear()`` for the change to be seen.
+    """
     return Settings()
 
 
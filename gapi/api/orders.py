@@ -6,18 +6,28 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import httpx
-from fastapi import APIRouter, Request, HTTPException, status, Header
+from fastapi import APIRouter, Depends, Request, HTTPException, status, Header
 from typing import Optional
 from pydantic import ValidationError
 from gapi.models.orders import CreateOrderRequest, InternalCreateOrderRequest, OrderResponse
+from gapi.clients.pulse_client import PulseClient
 from shared.observability.logger import get_logger
 from shared.observability.context import RequestContext
-from gapi.clients.pulse_client import PulseClient
 
 logger = get_logger("gapi.api.orders")
 router = APIRouter()
 
 
+def get_pulse_client(request: Request) -> PulseClient:
+    """Provide the Pulse client for a request.
+
+    The client is built once by the app lifespan, which also validates the
+    Pulse URL, so requests only look it up. Declared as a dependency so tests
+    can swap it via ``app.dependency_overrides`` instead of patching the module.
+    """
+    return request.app.state.pulse_client
+
+
 def validate_auth_token(authorization: Optional[str]) -> None:
     """Validate Bearer token.
     
@@ -71,7 +81,8 @@ def validate_auth_token(authorization: Optional[str]) -> None:
 async def create_order(
     request: Request,
     order_data: CreateOrderRequest,
-    authorization: Optional[str] = Header(None)
+    authorization: Optional[str] = Header(None),
+    pulse_client: PulseClient = Depends(get_pulse_client)
 ):
     """Place an order that supports splitting into multiple slices.
     
@@ -119,8 +130,6 @@ async def create_order(
     )
     
     # Call Pulse service
-    pulse_client = PulseClient()
-    
     try:
         response = await pulse_client.create_order(internal_request, ctx)
         
@@ -77,9 +77,12 @@ class PulseClient:
         })
         
         try:
+            # Serialize/parse JSON bytes directly in pydantic-core, skipping
+            # the intermediate dict + json.dumps/json.loads round-trips
             response = await client.post(
                 "/internal/orders",
-                json=order_data.model_dump()
+                content=order_data.model_dump_json(),
+                headers={"Content-Type": "application/json"}
             )
             response.raise_for_status()
             
@@ -87,7 +90,7 @@ class PulseClient:
                 "status_code": response.status_code
             })
             
-            return OrderResponse(**response.json())
+            return OrderResponse.model_validate_json(response.content)
             
         except httpx.HTTPStatusError as e:
             logger.error("Pulse returned error", ctx, data={
@@ -101,7 +104,4 @@ class PulseClient:
                 "error": str(e)
             })
             raise
-        
-        finally:
-            await client.close()
 
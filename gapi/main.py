@@ -3,24 +3,52 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from shared.observability.middleware import ContextMiddleware
-from shared.observability.logger import get_logger
+from shared.observability.logger import get_logger, start_log_writer, stop_log_writer
+from shared.http.client import shutdown_clients
 from gapi.api.orders import router as orders_router
+from gapi.clients.pulse_client import PulseClient
 
-app = FastAPI(title="GAPI")
-app.add_middleware(ContextMiddleware, service_name="gapi")
+logger = get_logger("gapi")
 
-# Register routers
-app.include_router(orders_router)
 
-logger = get_logger("gapi")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage application lifespan (startup/shutdown)."""
+    # Startup: build the Pulse client here so a missing PULSE_API_BASE_URL
+    # stops the service from starting instead of failing every order request
+    app.state.pulse_client = PulseClient()
+    start_log_writer()
+
+    yield
+
+    # Shutdown
+    await shutdown_clients()
+    logger.info("HTTP clients closed")
+    stop_log_writer()
+
+
+app = FastAPI(title="GAPI", lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_middleware(ContextMiddleware, service_name="gapi")
+
+# Liveness probes are the most frequent request: register /health ahead of the
+# routers so it matches first, and reuse one pre-encoded body instead of
+# serializing a dict on every call. Only the bytes are shared: a Response is
+# mutable (headers, cookies), so each call gets its own
+_HEALTH_BODY = b'{"status":"ok"}'
 
 
 @app.get("/health")
-def health():
+async def health():
     logger.info("Health check")
-    return {"status": "ok"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Register routers
+app.include_router(orders_router)
 
 
 @app.get("/api/hello")
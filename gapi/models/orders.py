@@ -1,9 +1,15 @@
 """GAPI-specific Pydantic models for order requests and responses."""
 
+import re
 from pydantic import BaseModel, Field, field_validator
 from typing import Literal
 
 
+# EXCHANGE:SYMBOL with a supported exchange and an uppercase alphanumeric symbol
+# containing at least one letter
+_INSTRUMENT_RE = re.compile(r'(?:NSE|BSE):[A-Z0-9]*[A-Z][A-Z0-9]*')
+
+
 class SplitConfig(BaseModel):
     """Split configuration for an order."""
     num_splits: int = Field(..., ge=2, le=100, description="Number of child orders to create")
@@ -23,6 +29,11 @@ class CreateOrderRequest(BaseModel):
     @classmethod
     def validate_instrument(cls, v: str) -> str:
         """Validate instrument format: EXCHANGE:SYMBOL"""
+        # Fast path: a single compiled match accepts every valid instrument;
+        # the checks below only run to pick the error message
+        if _INSTRUMENT_RE.fullmatch(v):
+            return v
+
         if ':' not in v:
             raise ValueError("Invalid instrument format. Expected EXCHANGE:SYMBOL")
         
@@ -34,18 +45,7 @@ class CreateOrderRequest(BaseModel):
         if exchange not in ['NSE', 'BSE']:
             raise ValueError(f"Unsupported exchange: {exchange}. Supported: NSE, BSE")
         
-        if not symbol.isalnum() or not symbol.isupper():
-            raise ValueError("Symbol must be alphanumeric and uppercase")
-        
-        return v
-    
-    @field_validator('total_quantity')
-    @classmethod
-    def validate_quantity_vs_splits(cls, v: int, info) -> int:
-        """Validate that total_quantity >= num_splits"""
-        # Note: split_config might not be set yet during validation
-        # This validation will be done at the endpoint level
-        return v
+        raise ValueError("Symbol must be alphanumeric and uppercase")
 
 
 class InternalCreateOrderRequest(BaseModel):
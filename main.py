@@ -2,12 +2,13 @@ import asyncio
 import logging.config
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from gapi.main import app as gapi_app
+from gapi.main import app as gapi_app, lifespan as gapi_lifespan
 from pulse.main import app as pulse_app, lifespan as pulse_lifespan, get_db_pool
 from pulse.workers.splitting_worker import run_splitting_worker
 from pulse.workers.execution_worker import run_execution_worker
 from pulse.workers.timeout_monitor import run_timeout_monitor
 from shared.observability.logger import get_logger
+from shared.http.client import shutdown_clients
 from shared.observability.access_log_middleware import AccessLogMiddleware
 from config.logging_config import LOGGING_CONFIG
 
@@ -19,9 +20,10 @@ logger = get_logger("pulse")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage application lifespan - initialize Pulse database pool and start background workers."""
-    # Start Pulse's lifespan (initializes database pool)
-    async with pulse_lifespan(pulse_app):
+    """Manage application lifespan - run the mounted apps' lifespans and start background workers."""
+    # Mounted apps' lifespans are not run by Starlette, so enter them here:
+    # GAPI's builds its Pulse client, Pulse's initializes the database pool
+    async with gapi_lifespan(gapi_app), pulse_lifespan(pulse_app):
         # Get the database pool from Pulse
         db_pool = get_db_pool()
 
@@ -88,6 +90,9 @@ async def lifespan(app: FastAPI):
 
             logger.info("Background workers stopped")
 
+            # Close shared outbound HTTP connection pools
+            await shutdown_clients()
+
 
 app = FastAPI(
     title="Pulse Backend",
@@ -122,6 +127,7 @@ if __name__ == "__main__":
         host="127.0.0.1",
         port=8000,
         reload=True,
+        loop="uvloop",  # libuv event loop (shipped with uvicorn[standard]); pairs well with asyncpg
         access_log=False,  # Disable uvicorn's default access logs (we use our own structured JSON logs)
         log_config=LOGGING_CONFIG  # Use custom JSON logging configuration
     )
@@ -20,7 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import get_settings
 from shared.database.pool import create_pool, close_pool
-from shared.observability.logger import get_logger
+from shared.observability.logger import get_logger, start_log_writer, stop_log_writer
 from pulse.workers.splitting_worker import run_splitting_worker
 from pulse.workers.execution_worker import run_execution_worker
 from pulse.workers.timeout_monitor import run_timeout_monitor
@@ -46,6 +46,7 @@ async def main():
     signal.signal(signal.SIGINT, handle_shutdown)
     signal.signal(signal.SIGTERM, handle_shutdown)
     
+    start_log_writer()
     logger.info("Starting Pulse background workers")
     
     try:
@@ -128,6 +129,7 @@ async def main():
             logger.info("Database pool closed")
         
         logger.info("Pulse background workers stopped")
+        stop_log_writer()
 
 
 if __name__ == "__main__":
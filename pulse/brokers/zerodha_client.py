@@ -15,6 +15,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import secrets
 from typing import Optional, Dict, Any
 from decimal import Decimal
 from datetime import datetime
@@ -156,8 +157,7 @@ class ZerodhaClient:
 
         if self.use_mock:
             # Mock implementation for development/testing
-            import uuid
-            broker_order_id = f"ZH{datetime.now().strftime('%y%m%d')}{uuid.uuid4().hex[:8]}"
+            broker_order_id = f"ZH{datetime.now().strftime('%y%m%d')}{secrets.token_hex(4)}"
 
             # Simulate different scenarios based on mock_scenario
             if self.mock_scenario == "rejection":
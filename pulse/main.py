@@ -5,9 +5,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from contextlib import asynccontextmanager
 import asyncpg
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from shared.observability.middleware import ContextMiddleware
-from shared.observability.logger import get_logger
+from shared.observability.logger import get_logger, start_log_writer, stop_log_writer
 from shared.database.pool import create_pool, close_pool
 from config.settings import get_settings
 from pulse.api.orders import router as orders_router
@@ -24,6 +25,7 @@ async def lifespan(app: FastAPI):
     global db_pool
 
     # Startup
+    start_log_writer()
     settings = get_settings()
     db_pool = await create_pool(settings)
     logger.info("Database pool created", data={
@@ -37,11 +39,25 @@ async def lifespan(app: FastAPI):
     # Shutdown
     await close_pool(db_pool)
     logger.info("Database pool closed")
+    stop_log_writer()
 
 
-app = FastAPI(title="Pulse", lifespan=lifespan)
+app = FastAPI(title="Pulse", lifespan=lifespan, default_response_class=ORJSONResponse)
 app.add_middleware(ContextMiddleware, service_name="pulse")
 
+# Liveness probes are the most frequent request: register /health ahead of the
+# routers so it matches first, and reuse one pre-encoded body instead of
+# serializing a dict on every call. Only the bytes are shared: a Response is
+# mutable (headers, cookies), so each call gets its own
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
+@app.get("/health")
+async def health():
+    logger.info("Health check")
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
 # Register routers
 app.include_router(orders_router)
 
@@ -51,12 +67,6 @@ def get_db_pool() -> asyncpg.Pool:
     return db_pool
 
 
-@app.get("/health")
-def health():
-    logger.info("Health check")
-    return {"status": "ok"}
-
-
 @app.get("/internal/hello")
 def hello():
     logger.info("Hello endpoint called", data={"endpoint": "/internal/hello"})
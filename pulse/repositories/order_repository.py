@@ -256,32 +256,50 @@ class OrderRepository(BaseRepository):
         limit: int,
         ctx: RequestContext
     ) -> list[dict]:
-        """Get pending orders for splitting (with locking).
+        """Claim pending orders for splitting.
 
-        Uses SELECT FOR UPDATE SKIP LOCKED for concurrency safety.
+        A single statement picks the oldest PENDING orders and moves them to
+        IN_PROGRESS, so the claim is committed by the same statement that picks
+        the rows. (A bare SELECT ... FOR UPDATE outside a transaction releases
+        its locks as soon as it returns, letting two workers pick the same
+        order.) SKIP LOCKED lets concurrent workers pass over each other's rows
+        instead of waiting on them. UPDATE ... RETURNING yields rows in no
+        particular order, so the result is re-sorted by created_at (FIFO).
 
         Args:
-            limit: Maximum number of orders to retrieve
+            limit: Maximum number of orders to claim
             ctx: Request context
 
         Returns:
-            List of order records
+            List of claimed order records (order_queue_status = IN_PROGRESS),
+            oldest first
         """
         conn = await self.get_connection()
         try:
             results = await conn.fetch(
                 """
-                SELECT * FROM orders
-                WHERE order_queue_status = 'PENDING'
+                WITH claimed AS (
+                    SELECT id FROM orders
+                    WHERE order_queue_status = 'PENDING'
+                    ORDER BY created_at ASC
+                    LIMIT $1
+                    FOR UPDATE SKIP LOCKED
+                ),
+                updated AS (
+                    UPDATE orders o
+                    SET order_queue_status = 'IN_PROGRESS'
+                    FROM claimed
+                    WHERE o.id = claimed.id
+                    RETURNING o.*
+                )
+                SELECT * FROM updated
                 ORDER BY created_at ASC
-                LIMIT $1
-                FOR UPDATE SKIP LOCKED
                 """,
                 limit
             )
 
             orders = [dict(row) for row in results]
-            logger.info("Retrieved pending orders", ctx, data={
+            logger.info("Claimed pending orders", ctx, data={
                 "count": len(orders)
             })
             return orders
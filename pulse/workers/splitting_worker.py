@@ -1,11 +1,10 @@
 """Splitting worker for processing pending orders.
 
 This worker:
-1. Picks pending orders using SELECT FOR UPDATE SKIP LOCKED
-2. Updates status to IN_PROGRESS
-3. Calculates split schedule using pulse.splitting
-4. Creates order slices in a transaction
-5. Updates parent order status to COMPLETED or FAILED
+1. Claims pending orders oldest first, moving them to IN_PROGRESS in one atomic UPDATE
+2. Calculates split schedule using pulse.splitting
+3. Creates order slices in a transaction
+4. Updates parent order status to COMPLETED or FAILED
 """
 
 import asyncio
@@ -65,9 +64,7 @@ async def process_single_order(
     )
 
     try:
-        # Update status to IN_PROGRESS immediately
-        await order_repo.update_order_status(order_id, 'IN_PROGRESS', order_ctx)
-        
+        # Already IN_PROGRESS: get_pending_orders claimed it
         logger.info("Processing order for splitting", order_ctx, data={
             "order_id": order_id,
             "total_quantity": order['total_quantity'],
@@ -169,7 +166,7 @@ async def run_splitting_worker(
                 span_source="PULSE_BACKGROUND:splitting_worker"
             )
 
-            # Get pending orders with pessimistic locking
+            # Claim pending orders (PENDING -> IN_PROGRESS in a single statement)
             pending_orders = await order_repo.get_pending_orders(batch_size, ctx)
 
             if not pending_orders:
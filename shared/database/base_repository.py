@@ -7,6 +7,10 @@ class BaseRepository:
     
     All repositories MUST inherit from this class and use the connection
     management methods to ensure proper pooling and resource cleanup.
+
+    Prefer ``async with self.connection() as conn`` for multi-statement work,
+    or the single-query helpers (``fetch``, ``fetchrow``, ``fetchval``,
+    ``execute``), which always return the connection to the pool.
     """
     
     def __init__(self, pool: asyncpg.Pool):
@@ -16,9 +20,43 @@ class BaseRepository:
             pool: asyncpg connection pool
         """
         self.pool = pool
+
+    def connection(self):
+        """Acquire a pooled connection as an async context manager.
+
+        Usage:
+            async with self.connection() as conn:
+                await conn.execute(...)
+
+        Returns:
+            asyncpg pool acquire context; releases the connection on exit
+        """
+        return self.pool.acquire()
+
+    async def fetch(self, query: str, *args) -> list:
+        """Run a query on a pooled connection and return all rows."""
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(query, *args)
+
+    async def fetchrow(self, query: str, *args):
+        """Run a query on a pooled connection and return the first row (or None)."""
+        async with self.pool.acquire() as conn:
+            return await conn.fetchrow(query, *args)
+
+    async def fetchval(self, query: str, *args):
+        """Run a query on a pooled connection and return a single value."""
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(query, *args)
+
+    async def execute(self, query: str, *args) -> str:
+        """Run a statement on a pooled connection and return its status string."""
+        async with self.pool.acquire() as conn:
+            return await conn.execute(query, *args)
     
     async def get_connection(self) -> asyncpg.Connection:
         """Get connection from pool.
+
+        Deprecated: use ``connection()`` as an async context manager instead.
         
         Returns:
             Database connection from pool
@@ -27,9 +65,10 @@ class BaseRepository:
     
     async def release_connection(self, conn: asyncpg.Connection):
         """Release connection back to pool.
+
+        Deprecated: use ``connection()`` as an async context manager instead.
         
         Args:
             conn: Connection to release
         """
         await self.pool.release(conn)
-
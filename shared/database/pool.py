@@ -5,6 +5,10 @@ from config.settings import Settings
 
 async def create_pool(settings: Settings) -> asyncpg.Pool:
     """Create database connection pool.
+
+    asyncpg already opens min_size connections here; warm_pool() then runs a
+    round trip on each, so startup fails fast on a bad connection. The pool is
+    closed if warm-up fails.
     
     Args:
         settings: Application settings with database configuration
@@ -12,7 +16,7 @@ async def create_pool(settings: Settings) -> asyncpg.Pool:
     Returns:
         asyncpg connection pool
     """
-    return await asyncpg.create_pool(
+    pool = await asyncpg.create_pool(
         host=settings.pulse_db_host,
         port=settings.pulse_db_port,
         user=settings.pulse_db_user,
@@ -20,9 +24,39 @@ async def create_pool(settings: Settings) -> asyncpg.Pool:
         database=settings.pulse_db_name,
         min_size=10,
         max_size=20,
-        max_queries=50000,
-        max_inactive_connection_lifetime=300.0
+        # Effectively never recycle busy connections by query count; idle
+        # connections are still closed after max_inactive_connection_lifetime
+        max_queries=10**9,
+        max_inactive_connection_lifetime=300.0,
+        command_timeout=5,
+        # Keep more prepared statements per connection (asyncpg default: 100)
+        statement_cache_size=1024
     )
+    try:
+        await warm_pool(pool)
+    except BaseException:
+        await pool.close()
+        raise
+    return pool
+
+
+async def warm_pool(pool: asyncpg.Pool):
+    """Run SELECT 1 on each of the pool's min_size connections.
+
+    Connections are already open; this only verifies each one with a round trip.
+
+    Args:
+        pool: Connection pool to warm
+    """
+    conns = []
+    try:
+        for _ in range(pool.get_min_size()):
+            conns.append(await pool.acquire())
+        for conn in conns:
+            await conn.execute("SELECT 1")
+    finally:
+        for conn in conns:
+            await pool.release(conn)
 
 
 async def close_pool(pool: asyncpg.Pool):
@@ -1,6 +1,93 @@
+import asyncio
+import warnings
 import httpx
-from typing import Optional, Dict, Any
-from shared.observability.context import get_context
+from typing import Dict, Any, Optional, Tuple
+from shared.observability.context import get_context_raw_headers
+
+# httpx clients keyed by (event loop, base_url, timeout) so every caller of the
+# same downstream shares one keep-alive connection pool. Pooled connections are
+# bound to the loop that opened them, so each loop gets its own clients.
+# Entries for loops that have since closed are dropped whenever a client is
+# created, so short-lived loops (asyncio.run, tests) do not accumulate
+_CLIENTS: Dict[Tuple[Optional[asyncio.AbstractEventLoop], str, float], httpx.AsyncClient] = {}
+
+
+def _client_key(base_url: str, timeout: float) -> Tuple[Optional[asyncio.AbstractEventLoop], str, float]:
+    """Return the _CLIENTS key for (base_url, timeout) on the running event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    return (loop, base_url, timeout)
+
+
+async def _inject_context_headers(request: httpx.Request) -> None:
+    """httpx request hook: set the context headers, replacing any the caller set.
+
+    The request context is the source of truth for tracing, so its values win
+    over caller-supplied X-Trace-*/X-Request-* headers.
+    """
+    raw_headers = get_context_raw_headers()
+    if not raw_headers:
+        return
+
+    # Pairs were encoded once per request context; update() replaces existing
+    # headers of the same name instead of appending duplicates
+    request.headers.update([raw for _, raw in raw_headers])
+
+
+def _get_shared_client(base_url: str, timeout: float) -> httpx.AsyncClient:
+    """Return the shared httpx client for (base_url, timeout), creating it if needed.
+
+    Creation has no await point, so it is atomic on the event loop and needs no lock.
+    """
+    key = _client_key(base_url, timeout)
+    client = _CLIENTS.get(key)
+    if client is None or client.is_closed:
+        _drop_closed_loop_clients()
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                # Must stay below the server's keep-alive timeout (uvicorn: 5s),
+                # or a POST can be sent on a connection the server already closed
+                keepalive_expiry=4,
+            ),
+            event_hooks={'request': [_inject_context_headers]},
+        )
+        _CLIENTS[key] = client
+    return client
+
+
+def _drop_closed_loop_clients() -> None:
+    """Forget clients whose event loop has closed.
+
+    Their connections died with the loop and cannot be closed any more, so
+    dropping the reference is all that is left to do.
+    """
+    for key in [key for key in _CLIENTS if key[0] is not None and key[0].is_closed()]:
+        del _CLIENTS[key]
+
+
+async def shutdown_clients() -> None:
+    """Close every shared httpx client and empty the registry.
+
+    Clients of the running loop (or created outside any loop) are closed here;
+    clients of another running loop are closed on that loop; clients of closed
+    or stopped loops are dropped, since their connections can no longer be used.
+
+    Call from the lifespan shutdown of every app that uses ContextPropagatingClient.
+    """
+    current = asyncio.get_running_loop()
+    clients = list(_CLIENTS.items())
+    _CLIENTS.clear()
+    for (loop, _, _), client in clients:
+        if loop is None or loop is current:
+            await client.aclose()
+        elif not loop.is_closed() and loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
 
 
 class ContextPropagatingClient:
@@ -10,6 +97,14 @@ class ContextPropagatingClient:
     Automatically adds headers for:
     - Tracing: X-Trace-Id, X-Request-Id, X-Trace-Source, X-Request-Source
 
+    Headers are injected by an httpx ``request`` event hook, so every request
+    sent through the underlying client (including redirects) carries context.
+    Verb methods (get/post/put/patch/delete/...) are delegated to httpx.
+
+    Instances with the same base_url and timeout on the same event loop share
+    one pooled httpx client, so there is nothing to close per instance: pools
+    are closed by ``shutdown_clients()`` and ``close()`` is deprecated.
+
     The receiving service will:
     - Build span_source from parent's request_source
 
@@ -21,62 +116,26 @@ class ContextPropagatingClient:
     
     def __init__(self, base_url: str, timeout: float = 30.0):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(base_url=base_url, timeout=timeout)
-    
-    def _add_context_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Add context to headers."""
-        headers = headers or {}
-        context = get_context()
-
-        # Map context fields to HTTP headers
-        # span_source is NOT sent - receiving service builds its own
-        header_mapping = {
-            'trace_id': 'X-Trace-Id',
-            'trace_source': 'X-Trace-Source',
-            'request_id': 'X-Request-Id',
-            'request_source': 'X-Request-Source',
-        }
-
-        for ctx_key, header_key in header_mapping.items():
-            if ctx_key in context and context[ctx_key]:
-                headers[header_key] = context[ctx_key]
-
-        return headers
-    
-    async def get(self, path: str, **kwargs) -> httpx.Response:
-        """GET request with auto-propagated context."""
-        kwargs['headers'] = self._add_context_headers(kwargs.get('headers'))
-        return await self.client.get(path, **kwargs)
-    
-    async def post(self, path: str, **kwargs) -> httpx.Response:
-        """POST request with auto-propagated context."""
-        kwargs['headers'] = self._add_context_headers(kwargs.get('headers'))
-        return await self.client.post(path, **kwargs)
+        self.client = _get_shared_client(base_url, timeout)
     
-    async def put(self, path: str, **kwargs) -> httpx.Response:
-        """PUT request with auto-propagated context."""
-        kwargs['headers'] = self._add_context_headers(kwargs.get('headers'))
-        return await self.client.put(path, **kwargs)
-    
-    async def patch(self, path: str, **kwargs) -> httpx.Response:
-        """PATCH request with auto-propagated context."""
-        kwargs['headers'] = self._add_context_headers(kwargs.get('headers'))
-        return await self.client.patch(path, **kwargs)
-    
-    async def delete(self, path: str, **kwargs) -> httpx.Response:
-        """DELETE request with auto-propagated context."""
-        kwargs['headers'] = self._add_context_headers(kwargs.get('headers'))
-        return await self.client.delete(path, **kwargs)
+    def __getattr__(self, name: str) -> Any:
+        """Delegate verb methods (get, post, ...) to the underlying httpx client."""
+        if name == 'client':
+            raise AttributeError(name)
+        return getattr(self.client, name)
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Deprecated: the pooled client is shared and closed by shutdown_clients()."""
+        warnings.warn(
+            "ContextPropagatingClient.close() does not close the shared connection "
+            "pool; call shutdown_clients() on application shutdown instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
     
     async def __aenter__(self):
         """Async context manager entry."""
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.close()
-
+        """Async context manager exit: nothing to release, the pool is shared."""
@@ -2,7 +2,6 @@
 
 import time
 from starlette.types import ASGIApp, Receive, Scope, Send
-from starlette.requests import Request as StarletteRequest
 from .logger import get_logger
 
 logger = get_logger("access")
@@ -28,7 +27,6 @@ class AccessLogMiddleware:
             await self.app(scope, receive, send)
             return
 
-        request = StarletteRequest(scope)
         start_time = time.time()
         status_code = 500  # Default to 500 if response never starts
 
@@ -57,8 +55,8 @@ class AccessLogMiddleware:
                 "HTTP request completed",
                 ctx,
                 data={
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": scope["method"],
+                    "path": scope["path"],
                     "status_code": status_code,
                     "duration_ms": round(duration_ms, 2),
                     "client_ip": client_host,
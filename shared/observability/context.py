@@ -1,20 +1,80 @@
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
+import os
 import time
-import secrets
 import re
+import threading
 from contextvars import ContextVar, Token
 
 
-TRACE_ID_PATTERN = re.compile(r'^t\d{10}[0-9a-f]{12}$')
-REQUEST_ID_PATTERN = re.compile(r'^r\d{10}[0-9a-f]{12}$')
+# Reference patterns for the id formats. Anchored with \A...\Z so .match() is
+# whole-string ('$' would also accept a trailing newline)
+TRACE_ID_PATTERN = re.compile(r'\At\d{10}[0-9a-f]{12}\Z')
+REQUEST_ID_PATTERN = re.compile(r'\Ar\d{10}[0-9a-f]{12}\Z')
 
+# Validation checks the same shape structurally, without the regex engine
+_ID_LENGTH = 23
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+
+# Context fields propagated to downstream services as HTTP headers
+# span_source is NOT sent - receiving service builds its own
+PROPAGATED_HEADERS = (
+    ('trace_id', 'X-Trace-Id'),
+    ('trace_source', 'X-Trace-Source'),
+    ('request_id', 'X-Request-Id'),
+    ('request_source', 'X-Request-Source'),
+)
 
 # Async-safe storage for the current request context
 _CURRENT_CONTEXT: ContextVar[Optional["RequestContext"]] = ContextVar(
     "current_request_context", default=None
 )
 
+# Propagation headers built for the context they were derived from, so repeated
+# outbound calls within one request reuse them: (ctx, raw pairs)
+_CONTEXT_HEADERS: ContextVar[Optional[Tuple["RequestContext", tuple]]] = ContextVar(
+    "current_context_headers", default=None
+)
+
+
+class _RandomHexPool:
+    """Serve random hex strings sliced from a buffered ``os.urandom`` block.
+
+    Amortizes the urandom syscall across many ids instead of paying it per id.
+    Thread-safe: the buffer and offset are only touched under a lock, so two
+    threads can never be handed the same bytes.
+    """
+
+    def __init__(self, block_size: int = 4096):
+        self._block_size = block_size
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def take(self, nbytes: int) -> str:
+        """Return ``nbytes`` random bytes as a lowercase hex string."""
+        with self._lock:
+            pos = self._pos
+            end = pos + nbytes
+            if end > len(self._buf):
+                self._buf = os.urandom(self._block_size)
+                pos, end = 0, nbytes
+            self._pos = end
+            chunk = self._buf[pos:end]
+        return chunk.hex()
+
+    def reset(self) -> None:
+        """Drop buffered bytes (e.g. after fork, so workers never share ids)."""
+        # A fresh lock too: the parent may have forked while another thread held it
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._pos = 0
+
+
+_HEX_POOL = _RandomHexPool()
+os.register_at_fork(after_in_child=_HEX_POOL.reset)
+
 
 def generate_trace_id() -> str:
     """
@@ -26,9 +86,7 @@ def generate_trace_id() -> str:
     Returns:
         str: A unique trace_id
     """
-    timestamp = int(time.time())
-    random_hex = secrets.token_hex(6)
-    return f"t{timestamp}{random_hex}"
+    return f"t{time.time_ns() // 1_000_000_000}{_HEX_POOL.take(6)}"
 
 
 def generate_request_id() -> str:
@@ -41,9 +99,22 @@ def generate_request_id() -> str:
     Returns:
         str: A unique request_id
     """
-    timestamp = int(time.time())
-    random_hex = secrets.token_hex(6)
-    return f"r{timestamp}{random_hex}"
+    return f"r{time.time_ns() // 1_000_000_000}{_HEX_POOL.take(6)}"
+
+
+def generate_trace_and_request_ids() -> Tuple[str, str]:
+    """
+    Generate a new trace_id and request_id together.
+
+    Both ids share one clock read and one draw from the hex pool, for requests
+    that arrive with neither id set.
+
+    Returns:
+        Tuple[str, str]: (trace_id, request_id)
+    """
+    ts = time.time_ns() // 1_000_000_000
+    rand = _HEX_POOL.take(12)
+    return f"t{ts}{rand[:12]}", f"r{ts}{rand[12:]}"
 
 
 def is_valid_trace_id(trace_id: str) -> bool:
@@ -56,7 +127,7 @@ def is_valid_trace_id(trace_id: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    return bool(TRACE_ID_PATTERN.match(trace_id))
+    return _is_valid_id(trace_id, 't')
 
 
 def is_valid_request_id(request_id: str) -> bool:
@@ -69,10 +140,21 @@ def is_valid_request_id(request_id: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    return bool(REQUEST_ID_PATTERN.match(request_id))
+    return _is_valid_id(request_id, 'r')
+
 
+def _is_valid_id(value: str, prefix: str) -> bool:
+    """Check prefix + 10 ASCII digits + 12 lowercase hex chars."""
+    return (
+        len(value) == _ID_LENGTH
+        and value[0] == prefix
+        and value.isascii()
+        and value[1:11].isdigit()
+        and _HEX_DIGITS.issuperset(value[11:])
+    )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RequestContext:
     """
     Request context passed explicitly through the application.
@@ -91,16 +173,22 @@ class RequestContext:
     request_id: str
     request_source: str
     span_source: str
+    # Logging fields, built once since the context is immutable. Read-only:
+    # use to_dict() for a copy that can be modified
+    _log_fields: Dict[str, Any] = field(init=False, repr=False, compare=False)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for logging."""
-        return {
+    def __post_init__(self):
+        object.__setattr__(self, '_log_fields', {
             'trace_id': self.trace_id,
             'trace_source': self.trace_source,
             'request_id': self.request_id,
             'request_source': self.request_source,
             'span_source': self.span_source
-        }
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return dict(self._log_fields)
 
 
 # --- ContextVar helpers for async-safe access outside route handlers ---
@@ -134,3 +222,33 @@ def get_context() -> Dict[str, Any]:
     ctx = _CURRENT_CONTEXT.get()
     return ctx.to_dict() if ctx else {}
 
+
+def get_context_raw_headers() -> Tuple[Tuple[bytes, Tuple[bytes, bytes]], ...]:
+    """Get the headers to propagate for the current context, pre-encoded to bytes.
+
+    Returns (lowercase_name, (header_bytes, value_bytes)) pairs so callers can
+    check for an existing header and write the encoded pair without any
+    per-request encoding. Built once per RequestContext and reused by later
+    calls in the same request. Returns an empty tuple when no context is set.
+    """
+    ctx = _CURRENT_CONTEXT.get()
+    if ctx is None:
+        return ()
+
+    cached = _CONTEXT_HEADERS.get()
+    if cached is not None and cached[0] is ctx:
+        return cached[1]
+
+    headers = tuple(
+        (header_key, value)
+        for ctx_key, header_key in PROPAGATED_HEADERS
+        if (value := getattr(ctx, ctx_key))
+    )
+    # Encode once per context as ASCII, like httpx's own header normalisation:
+    # a non-ASCII value raises here, before any request is sent
+    raw_headers = tuple(
+        (header_key.lower().encode('ascii'), (header_key.encode('ascii'), value.encode('ascii')))
+        for header_key, value in headers
+    )
+    _CONTEXT_HEADERS.set((ctx, raw_headers))
+    return raw_headers
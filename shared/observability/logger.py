@@ -1,11 +1,21 @@
 import json
 import logging
+import queue
+import select
 import sys
-from datetime import datetime, timezone
+import threading
+import time
 from typing import Any, Optional, Dict
 
 from .context import RequestContext
 
+try:
+	import orjson
+	ORJSON_AVAILABLE = True
+except ImportError:
+	ORJSON_AVAILABLE = False
+	orjson = None
+
 
 # Security: Keys that should never be logged (top-level fields)
 FORBIDDEN_KEYS = {
@@ -20,6 +30,10 @@ FORBIDDEN_KEYS = {
 	"auth",
 }
 
+# First letters of FORBIDDEN_KEYS: most kwargs are ruled out on their first
+# character without lowercasing the whole key
+_FORBIDDEN_FIRST_CHARS = frozenset(key[0] for key in FORBIDDEN_KEYS)
+
 # Fields that are allowed as top-level structured keys rather than inside `data`
 STRUCTURED_KEYS = {
 	"trace_id",
@@ -31,6 +45,199 @@ STRUCTURED_KEYS = {
 }
 
 
+def _dumps(log_entry: Dict[str, Any]) -> bytes:
+	"""Serialize a log entry to compact UTF-8 JSON (orjson when installed)."""
+	if ORJSON_AVAILABLE:
+		return orjson.dumps(log_entry, option=orjson.OPT_NON_STR_KEYS)
+	return json.dumps(log_entry, separators=(",", ":")).encode()
+
+
+# Serializes writes so lines from different threads never interleave. Reentrant,
+# like logging's handler locks, so a signal handler that logs cannot deadlock
+_stdout_lock = threading.RLock()
+
+
+def _write_text(text: str) -> None:
+	"""Write and flush text on the current ``sys.stdout``.
+
+	``sys.stdout`` is looked up on every call so redirection (e.g. pytest
+	capture) is honoured, and output is flushed as a StreamHandler would.
+	"""
+	with _stdout_lock:
+		stream = sys.stdout
+		stream.write(text)
+		stream.flush()
+
+
+# Queue marker asking the writer thread to exit once everything before it is written
+_STOP = object()
+
+
+class _LogWriter:
+	"""Background thread that batches queued log lines onto ``sys.stdout``.
+
+	Producers put lines on a ``queue.SimpleQueue``, whose put takes no
+	Python-level lock (so it is safe from signal handlers). The thread drains
+	whatever is queued and writes it with one ``write``/``flush`` per batch of
+	at most ``max_batch_bytes`` (``PIPE_BUF`` by default, so a batch reaches a
+	pipe atomically). Once ``max_pending`` lines are waiting, new lines are
+	dropped; the writer reports how many in a WARNING line of its own.
+	"""
+
+	def __init__(self, max_pending: int = 10_000, max_batch_bytes: int = select.PIPE_BUF):
+		self.max_pending = max_pending
+		self.max_batch_bytes = max_batch_bytes
+		self.dropped = 0
+		self._reported = 0
+		self._queue: queue.SimpleQueue = queue.SimpleQueue()
+		self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+
+	def start(self) -> None:
+		self._thread.start()
+
+	def put(self, text: str) -> None:
+		"""Queue one line (including its newline), or count it as dropped."""
+		if self._queue.qsize() >= self.max_pending:
+			self.dropped += 1
+			return
+		self._queue.put(text)
+
+	def stop(self, timeout: Optional[float] = None) -> None:
+		"""Write out everything queued so far, then stop the thread."""
+		self._queue.put(_STOP)
+		self._thread.join(timeout)
+		# Lines queued after the stop marker are written synchronously
+		self._drain()
+
+	def _run(self) -> None:
+		while self._drain(block=True):
+			pass
+
+	def _drain(self, block: bool = False) -> bool:
+		"""Write queued lines in batches; return False once the stop marker is seen."""
+		q = self._queue
+		try:
+			item = q.get() if block else q.get_nowait()
+		except queue.Empty:
+			return True
+
+		running = True
+		batch: list = []
+		size = 0
+		while True:
+			if item is _STOP:
+				running = False
+			else:
+				if batch and size + len(item) > self.max_batch_bytes:
+					self._write_batch(batch)
+					batch, size = [], 0
+				batch.append(item)
+				size += len(item)
+			try:
+				item = q.get_nowait()
+			except queue.Empty:
+				break
+		if batch:
+			self._write_batch(batch)
+		self._report_dropped()
+		return running
+
+	def _write_batch(self, batch: list) -> None:
+		try:
+			_write_text("".join(batch))
+		except (OSError, ValueError):
+			# stdout is gone or closed; keep the thread alive for later lines
+			pass
+
+	def _report_dropped(self) -> None:
+		dropped = self.dropped
+		if dropped == self._reported:
+			return
+		newly_dropped = dropped - self._reported
+		self._reported = dropped
+		self._write_batch([_dumps({
+			"timestamp": _utc_timestamp(),
+			"level": "WARNING",
+			"logger": __name__,
+			"message": "Dropped log lines",
+			"data": {"dropped": newly_dropped, "total_dropped": dropped},
+		}).decode() + "\n"])
+
+
+# Background writer, when a service has started one; None means synchronous writes
+_writer: Optional[_LogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def start_log_writer(max_pending: int = 10_000) -> None:
+	"""Batch log lines on a background thread from now on.
+
+	Called from service startup (lifespan / worker main); pair it with
+	``stop_log_writer`` on shutdown. Until then, and in tests, lines are
+	written synchronously.
+	"""
+	global _writer
+	with _writer_lock:
+		if _writer is None:
+			writer = _LogWriter(max_pending)
+			writer.start()
+			_writer = writer
+
+
+def stop_log_writer(timeout: float = 5.0) -> None:
+	"""Write out queued lines and go back to synchronous writes."""
+	global _writer
+	with _writer_lock:
+		writer, _writer = _writer, None
+	if writer is not None:
+		writer.stop(timeout)
+
+
+def _write_line(line: bytes) -> None:
+	"""Write one encoded JSON log line to stdout.
+
+	Lines are already fully formatted, so they bypass the logging module. With
+	a background writer running they are queued for it, otherwise written
+	synchronously.
+	"""
+	text = line.decode() + "\n"
+	writer = _writer
+	if writer is not None:
+		writer.put(text)
+	else:
+		_write_text(text)
+
+
+# Numeric levels by name, so disabled calls are rejected before any formatting
+_LEVELS = {
+	"DEBUG": logging.DEBUG,
+	"INFO": logging.INFO,
+	"WARNING": logging.WARNING,
+	"ERROR": logging.ERROR,
+	"CRITICAL": logging.CRITICAL,
+}
+
+
+# (epoch millisecond, formatted timestamp) of the last log line; the string is
+# only rebuilt when the millisecond changes. Swapped as one tuple so concurrent
+# readers never see a mismatched pair.
+_timestamp_cache = (0, "")
+
+
+def _utc_timestamp() -> str:
+	"""Current UTC time as ISO-8601 with millisecond precision (e.g. 2026-01-01T00:00:00.123Z)."""
+	global _timestamp_cache
+	now_ms = time.time_ns() // 1_000_000
+	cached_ms, cached = _timestamp_cache
+	if now_ms == cached_ms:
+		return cached
+
+	seconds, millis = divmod(now_ms, 1000)
+	formatted = f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{millis:03d}Z"
+	_timestamp_cache = (now_ms, formatted)
+	return formatted
+
+
 class StructuredLogger:
 	"""Structured JSON logger that accepts RequestContext explicitly.
 
@@ -39,15 +246,10 @@ class StructuredLogger:
 	    logger.info("Order created", ctx, data={"instrument": "NSE:RELIANCE"})
 	"""
 
-	def __init__(self, logger_name: str):
+	def __init__(self, logger_name: str, level: int = logging.DEBUG):
 		self.logger_name = logger_name
-		self.logger = logging.getLogger(logger_name)
-		self.logger.setLevel(logging.DEBUG)
-
-		handler = logging.StreamHandler(sys.stdout)
-		handler.setFormatter(logging.Formatter('%(message)s'))
-		self.logger.addHandler(handler)
-		self.logger.propagate = False
+		# Minimum level emitted (standard logging level numbers)
+		self.level = level
 
 	def _sanitize_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
 		"""Remove forbidden *top-level* keys for security.
@@ -60,7 +262,12 @@ class StructuredLogger:
 		``data`` payload) to remove forbidden keys like Authorization
 		headers, while keeping performance overhead reasonable.
 		"""
-		return {k: v for k, v in kwargs.items() if k.lower() not in FORBIDDEN_KEYS}
+		if not kwargs:
+			return kwargs
+		return {
+			k: v for k, v in kwargs.items()
+			if not (k and k[0].lower() in _FORBIDDEN_FIRST_CHARS and k.lower() in FORBIDDEN_KEYS)
+		}
 
 	def _log(self, level: str, message: str, ctx: Optional[RequestContext] = None, **kwargs):
 		"""Internal log method.
@@ -71,28 +278,43 @@ class StructuredLogger:
 		3. Structured top-level overrides (trace_id, order_id, ...)
 		4. Arbitrary user-provided kwargs nested under ``data``
 		"""
-		# Base log entry
-		log_entry: Dict[str, Any] = {
-			"timestamp": datetime.now(timezone.utc)
-			.isoformat()
-			.replace("+00:00", "Z"),
-			"level": level,
-			"logger": self.logger_name,
-			"message": message,
-		}
+		# Skip all formatting work for levels the logger would drop anyway
+		if _LEVELS[level] < self.level:
+			return
 
-		# Include context if provided (trace_id, request_id, span_source, ...)
-		if ctx:
-			log_entry.update(ctx.to_dict())
+		# Base log entry, with context fields (trace_id, request_id, span_source, ...)
+		# merged in the same literal when ctx is provided
+		if ctx is not None:
+			log_entry: Dict[str, Any] = {
+				"timestamp": _utc_timestamp(),
+				"level": level,
+				"logger": self.logger_name,
+				"message": message,
+				**ctx._log_fields,
+			}
+		else:
+			log_entry = {
+				"timestamp": _utc_timestamp(),
+				"level": level,
+				"logger": self.logger_name,
+				"message": message,
+			}
 
+		if kwargs:
+			self._add_kwargs(log_entry, kwargs)
+
+		# Output JSON
+		_write_line(_dumps(log_entry))
+
+	def _add_kwargs(self, log_entry: Dict[str, Any], kwargs: Dict[str, Any]) -> None:
+		"""Merge user-provided kwargs into log_entry (steps 3 and 4 of ``_log``)."""
 		# Sanitize user-provided kwargs first
 		safe_kwargs = self._sanitize_kwargs(kwargs)
 
 		# 1) Allow known structured fields to override context values at the top level
 		#    (e.g. trace_id, order_id).
-		for key in list(STRUCTURED_KEYS):
-			if key in safe_kwargs:
-				log_entry[key] = safe_kwargs.pop(key)
+		for key in STRUCTURED_KEYS.intersection(safe_kwargs):
+			log_entry[key] = safe_kwargs.pop(key)
 
 		# 2) Everything else goes under the standard `data` envelope.
 		data_payload: Dict[str, Any] = {}
@@ -113,12 +335,6 @@ class StructuredLogger:
 		if data_payload:
 			log_entry["data"] = data_payload
 
-		# Output JSON
-		log_line = json.dumps(log_entry)
-
-		log_method = getattr(self.logger, level.lower())
-		log_method(log_line)
-
 	def debug(self, message: str, ctx: Optional[RequestContext] = None, **kwargs):
 		"""Log debug message with context."""
 		self._log("DEBUG", message, ctx, **kwargs)
@@ -140,7 +356,7 @@ class StructuredLogger:
 		self._log("CRITICAL", message, ctx, **kwargs)
 
 
-def get_logger(logger_name: str) -> StructuredLogger:
-    """Get a structured logger with the given name."""
-    return StructuredLogger(logger_name)
+def get_logger(logger_name: str, level: int = logging.DEBUG) -> StructuredLogger:
+    """Get a structured logger with the given name and minimum level."""
+    return StructuredLogger(logger_name, level)
 
@@ -1,15 +1,42 @@
-from fastapi import Request
+import functools
+from typing import Dict, Iterable, Tuple
 from starlette.types import ASGIApp, Receive, Scope, Send
-from starlette.requests import Request as StarletteRequest
-from starlette.responses import Response
 from .context import (
     RequestContext,
     generate_trace_id,
     generate_request_id,
+    generate_trace_and_request_ids,
     set_current_context,
     reset_current_context,
 )
 
+# Lowercase names of the request headers ContextMiddleware reads (ASGI servers
+# send header names lowercased)
+_CONTEXT_HEADER_NAMES = frozenset({
+    b"x-trace-id",
+    b"x-trace-source",
+    b"x-request-id",
+    b"x-request-source",
+})
+
+# Response header names, encoded once
+_TRACE_ID_HEADER = b"x-trace-id"
+_REQUEST_ID_HEADER = b"x-request-id"
+
+
+def _read_context_headers(raw_headers: Iterable[Tuple[bytes, bytes]]) -> Dict[bytes, bytes]:
+    """Pick the tracing headers out of ASGI ``scope["headers"]`` in one pass.
+
+    Keeps the first value of a repeated header, like ``Headers.get()``. Values
+    stay bytes; callers decode them as latin-1 (like Starlette) only where a
+    str is needed.
+    """
+    found: Dict[bytes, bytes] = {}
+    for name, value in raw_headers:
+        if name in _CONTEXT_HEADER_NAMES and name not in found:
+            found[name] = value
+    return found
+
 
 class ContextMiddleware:
     """
@@ -20,39 +47,73 @@ class ContextMiddleware:
 
     Generates trace_id, request_id if not provided.
     Builds span_source by appending current request_source to parent's request_source.
+
+    Requests to ``bypass_paths`` (e.g. a metrics scrape endpoint) skip the
+    middleware entirely: no context, no tracing response headers. Empty by
+    default, since /health responses are expected to carry tracing headers.
     """
 
-    def __init__(self, app: ASGIApp, service_name: str):
+    def __init__(
+        self,
+        app: ASGIApp,
+        service_name: str,
+        bypass_paths: Iterable[str] = (),
+    ):
         self.app = app
         self.service_name = service_name
+        self.bypass_paths = frozenset(bypass_paths)
+        self._service_prefix = f"{service_name.upper()}:"
+        # Bounded: the route set is small, but raw paths can embed ids
+        self._request_source = functools.lru_cache(maxsize=1024)(self._build_request_source)
+
+    def _build_request_source(self, method: str, path: str) -> str:
+        """Build the request_source for an endpoint, e.g. GAPI:POST/api/orders."""
+        return f"{self._service_prefix}{method}{path}"
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] != "http":
+        if scope["type"] != "http" or scope["path"] in self.bypass_paths:
             await self.app(scope, receive, send)
             return
 
-        # Create request to access headers
-        request = StarletteRequest(scope)
-
-        # Extract or generate tracing IDs
-        trace_id = request.headers.get('X-Trace-Id') or generate_trace_id()
-        request_id = request.headers.get('X-Request-Id') or generate_request_id()
-
-        # Get HTTP method and path for endpoint identifier
-        method = scope.get("method", "GET")
-        path = scope.get("path", "/")
-        endpoint_code = f"{method}{path}"
-        trace_source_header = request.headers.get('X-Trace-Source')
-
-        # Create initial context with method and path
-        trace_source = trace_source_header or f"{self.service_name.upper()}:{endpoint_code}"
-        request_source = f"{self.service_name.upper()}:{endpoint_code}"
+        # Read only the tracing headers, without building a Request/Headers
+        headers = _read_context_headers(scope.get("headers", ()))
+
+        # Extract or generate tracing IDs. Ids are kept as bytes too, so ids
+        # from request headers go back out on the response without re-encoding
+        trace_id_bytes = headers.get(b"x-trace-id")
+        request_id_bytes = headers.get(b"x-request-id")
+        if trace_id_bytes and request_id_bytes:
+            # Internal call with both ids: decode only, nothing to generate
+            trace_id = trace_id_bytes.decode("latin-1")
+            request_id = request_id_bytes.decode("latin-1")
+        elif not trace_id_bytes and not request_id_bytes:
+            # New trace at the edge: one clock read and one random draw
+            trace_id, request_id = generate_trace_and_request_ids()
+            trace_id_bytes = trace_id.encode("ascii")
+            request_id_bytes = request_id.encode("ascii")
+        else:
+            # Only one id supplied: keep it and generate the other
+            if trace_id_bytes:
+                trace_id = trace_id_bytes.decode("latin-1")
+            else:
+                trace_id = generate_trace_id()
+                trace_id_bytes = trace_id.encode("ascii")
+            if request_id_bytes:
+                request_id = request_id_bytes.decode("latin-1")
+            else:
+                request_id = generate_request_id()
+                request_id_bytes = request_id.encode("ascii")
+
+        # Endpoint identifier from HTTP method and path
+        request_source = self._request_source(scope.get("method", "GET"), scope.get("path", "/"))
+        trace_source_bytes = headers.get(b"x-trace-source")
+        trace_source = trace_source_bytes.decode("latin-1") if trace_source_bytes else request_source
 
         # Build span_source: if we have parent request source, append current service
         # Otherwise, just use current service
-        parent_request_source = request.headers.get('X-Request-Source')
+        parent_request_source = headers.get(b"x-request-source")
         if parent_request_source:
-            span_source = f"{parent_request_source}->{request_source}"
+            span_source = f"{parent_request_source.decode('latin-1')}->{request_source}"
         else:
             span_source = request_source
 
@@ -71,14 +132,18 @@ class ContextMiddleware:
         # Also set process-local async context for downstream utilities (e.g., HTTP client, logger)
         token = set_current_context(ctx)
 
+        # Response tracing headers
+        tracing_headers = (
+            (_TRACE_ID_HEADER, trace_id_bytes),
+            (_REQUEST_ID_HEADER, request_id_bytes),
+        )
+
         # Wrap send to add headers to response
         async def send_with_headers(message):
             if message["type"] == "http.response.start":
-                # Add tracing headers to response
-                headers = list(message.get("headers", []))
-                headers.append((b"x-trace-id", trace_id.encode()))
-                headers.append((b"x-request-id", request_id.encode()))
-                message["headers"] = headers
+                # New list in one allocation: the original may be the
+                # response's own raw_headers, so it is not mutated
+                message["headers"] = [*message.get("headers", ()), *tracing_headers]
             await send(message)
 
         try:
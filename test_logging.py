@@ -2,7 +2,7 @@
 """Test script to demonstrate structured logging"""
 
 from shared.observability.logger import get_logger
-from shared.observability.context import set_trace_context
+from shared.observability.context import RequestContext
 
 logger = get_logger("gapi")
 
@@ -10,18 +10,16 @@ print("=== Example 1: Basic log ===")
 logger.info("Service started")
 
 print("\n=== Example 2: Log with tracing context ===")
-set_trace_context(
+ctx = RequestContext(
     trace_id="t-8fa21c9d",
     trace_source="GAPI:create_order",
     request_id="r-912873",
-    request_source="GAPI:create_order"
+    request_source="GAPI:create_order",
+    span_source="GAPI:create_order"
 )
 logger.info(
     "Received order creation request",
-    trace_id="t-8fa21c9d",
-    trace_source="GAPI:create_order",
-    request_id="r-912873",
-    request_source="GAPI:create_order",
+    ctx,
     data={"instrument": "NSE:RELIANCE", "action": "BUY"}
 )
 
@@ -0,0 +1,22 @@
+"""Shared fixtures for the whole test suite."""
+import asyncio
+import sys
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # Installed via uvicorn[standard], except on Windows
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when available, as the services do under uvicorn.
+
+    pytest-asyncio builds every test event loop from this policy; uvloop
+    speeds up asyncpg-heavy integration tests.
+    """
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.EventLoopPolicy()
+    return asyncio.get_event_loop_policy()
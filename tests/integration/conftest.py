@@ -0,0 +1,38 @@
+"""Shared fixtures for integration tests."""
+import pytest
+import pytest_asyncio
+from shared.database.pool import create_pool, close_pool
+from config.settings import get_settings
+from tests.integration.helpers import SingleConnectionPool
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Session-wide Settings, resolved once instead of in every test."""
+    return get_settings()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_pool(settings):
+    """Session-wide connection pool, so connections are established once per run."""
+    pool = await create_pool(settings)
+    yield pool
+    await close_pool(pool)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_conn(db_pool):
+    """Connection inside a transaction that is always rolled back, so tests leave no rows behind."""
+    async with db_pool.acquire() as conn:
+        tr = conn.transaction()
+        await tr.start()
+        try:
+            yield conn
+        finally:
+            await tr.rollback()
+
+
+@pytest.fixture
+def tx_pool(db_conn):
+    """Pool stand-in over db_conn, for repositories whose writes should be rolled back."""
+    return SingleConnectionPool(db_conn)
@@ -0,0 +1,124 @@
+"""Seed helpers for database integration tests.
+
+Each seed helper issues a single statement (or one COPY), so per-test setup
+costs one round-trip to Postgres instead of one per table or per row. Seeded
+rows are not deleted: most tests run inside the ``db_conn`` transaction,
+which is rolled back.
+"""
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import uuid4
+from shared.observability.context import RequestContext, generate_request_id
+
+_ORDER_COLUMNS = (
+    'id', 'order_unique_key', 'instrument', 'side', 'total_quantity', 'num_splits',
+    'duration_minutes', 'randomize', 'order_queue_status', 'origin_trace_id',
+    'origin_trace_source', 'origin_request_id', 'origin_request_source', 'request_id'
+)
+
+_SEED_ORDER_SLICE = """
+    WITH ins_order AS (
+        INSERT INTO orders (
+            id, order_unique_key, instrument, side, total_quantity, num_splits, duration_minutes,
+            randomize, order_queue_status, origin_trace_id, origin_trace_source,
+            origin_request_id, origin_request_source, request_id
+        )
+        VALUES ($1, $2, 'NSE:RELIANCE', 'BUY', 100, 1, 60, FALSE, 'COMPLETED', $3, $4, $5, $6, $5)
+        RETURNING id
+    )
+    INSERT INTO order_slices (
+        id, order_id, instrument, side, quantity, sequence_number,
+        scheduled_at, status, request_id
+    )
+    VALUES ($7, (SELECT id FROM ins_order), 'NSE:RELIANCE', 'BUY', 100, 1, $8, 'PENDING', $5)
+"""
+
+_SEED_ORDER_SLICE_EXECUTION = """
+    WITH ins_order AS (
+        INSERT INTO orders (
+            id, order_unique_key, instrument, side, total_quantity, num_splits, duration_minutes,
+            randomize, order_queue_status, origin_trace_id, origin_trace_source,
+            origin_request_id, origin_request_source, request_id
+        )
+        VALUES ($1, $2, 'NSE:RELIANCE', 'BUY', 100, 1, 60, FALSE, 'COMPLETED', $3, $4, $5, $6, $5)
+        RETURNING id
+    ),
+    ins_slice AS (
+        INSERT INTO order_slices (
+            id, order_id, instrument, side, quantity, sequence_number,
+            scheduled_at, status, request_id
+        )
+        VALUES ($7, (SELECT id FROM ins_order), 'NSE:RELIANCE', 'BUY', 100, 1, $8, 'PENDING', $5)
+        RETURNING id
+    )
+    INSERT INTO order_slice_executions (
+        id, slice_id, attempt_id, executor_id, execution_status,
+        executor_claimed_at, executor_timeout_at, last_heartbeat_at,
+        placement_attempts, request_id
+    )
+    VALUES ($9, (SELECT id FROM ins_slice), $10, 'test-worker-1', 'CLAIMED', $8, $8, $8, 0, $5)
+"""
+
+
+async def seed_order_slice(conn, ctx: RequestContext) -> tuple[str, str]:
+    """Insert a COMPLETED order with one PENDING slice in one statement.
+
+    Returns:
+        (order_id, slice_id)
+    """
+    order_id = f"test_ord_{generate_request_id()[-8:]}"
+    slice_id = f"test_slice_{generate_request_id()[-8:]}"
+    await conn.execute(
+        _SEED_ORDER_SLICE,
+        order_id, f"ouk_test_{generate_request_id()[-8:]}",
+        ctx.trace_id, ctx.trace_source, ctx.request_id, ctx.request_source,
+        slice_id, datetime.now(timezone.utc)
+    )
+    return order_id, slice_id
+
+
+async def seed_order_slice_execution(conn, ctx: RequestContext) -> tuple[str, str, str]:
+    """Insert an order, its slice and a CLAIMED execution in one statement.
+
+    Returns:
+        (order_id, slice_id, execution_id)
+    """
+    order_id = f"test_ord_{generate_request_id()[-8:]}"
+    slice_id = f"test_slice_{generate_request_id()[-8:]}"
+    execution_id = f"test_exec_{generate_request_id()[-8:]}"
+    await conn.execute(
+        _SEED_ORDER_SLICE_EXECUTION,
+        order_id, f"ouk_test_{generate_request_id()[-8:]}",
+        ctx.trace_id, ctx.trace_source, ctx.request_id, ctx.request_source,
+        slice_id, datetime.now(timezone.utc),
+        execution_id, f"attempt-{generate_request_id()[-8:]}"
+    )
+    return order_id, slice_id, execution_id
+
+
+async def seed_pending_orders(
+    conn, ctx: RequestContext, count: int, created_at: Optional[list[datetime]] = None
+) -> list[str]:
+    """Insert ``count`` PENDING orders with a single COPY.
+
+    Args:
+        created_at: Per-order creation times; defaults to the current time for all
+
+    Returns:
+        The new order ids
+    """
+    order_ids = [f"test_bulk_{uuid4().hex}" for _ in range(count)]
+    created_at = created_at or [datetime.now(timezone.utc)] * count
+    await conn.copy_records_to_table(
+        'orders',
+        records=[
+            (
+                order_id, f"ouk_{order_id}", 'NSE:RELIANCE', 'BUY', 100, 1, 60, False, 'PENDING',
+                ctx.trace_id, ctx.trace_source, ctx.request_id, ctx.request_source,
+                generate_request_id(), order_created_at
+            )
+            for order_id, order_created_at in zip(order_ids, created_at)
+        ],
+        columns=_ORDER_COLUMNS + ('created_at',)
+    )
+    return order_ids
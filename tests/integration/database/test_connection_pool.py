@@ -2,15 +2,13 @@
 import pytest
 import asyncpg
 from shared.database.pool import create_pool, close_pool
-from config.settings import get_settings
 
+# All tests share the session-scoped pool (and event loop) from tests/integration/conftest.py
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.mark.asyncio
-async def test_create_pool_success():
+
+async def test_create_pool_success(settings):
     """Test creating database connection pool."""
-    # Arrange
-    settings = get_settings()
-    
     # Act
     pool = await create_pool(settings)
     
@@ -22,17 +20,12 @@ async def test_create_pool_success():
     await close_pool(pool)
 
 
-@pytest.mark.asyncio
-async def test_pool_can_acquire_connection():
+async def test_pool_can_acquire_connection(db_pool):
     """Test acquiring connection from pool."""
-    # Arrange
-    settings = get_settings()
-    pool = await create_pool(settings)
+    # Act
+    conn = await db_pool.acquire()
     
     try:
-        # Act
-        conn = await pool.acquire()
-        
         # Assert
         assert conn is not None
         assert isinstance(conn, asyncpg.Connection)
@@ -40,45 +33,28 @@ async def test_pool_can_acquire_connection():
         # Test simple query
         result = await conn.fetchval("SELECT 1")
         assert result == 1
-        
-        # Release connection
-        await pool.release(conn)
     finally:
-        # Cleanup
-        await close_pool(pool)
+        # Release connection
+        await db_pool.release(conn)
 
 
-@pytest.mark.asyncio
-async def test_pool_can_execute_query():
+async def test_pool_can_execute_query(db_pool):
     """Test executing query through pool."""
-    # Arrange
-    settings = get_settings()
-    pool = await create_pool(settings)
+    # Act
+    async with db_pool.acquire() as conn:
+        result = await conn.fetchval("SELECT 1 + 1")
     
-    try:
-        # Act
-        async with pool.acquire() as conn:
-            result = await conn.fetchval("SELECT 1 + 1")
-        
-        # Assert
-        assert result == 2
-    finally:
-        # Cleanup
-        await close_pool(pool)
+    # Assert
+    assert result == 2
 
 
-@pytest.mark.asyncio
-async def test_pool_multiple_connections():
+async def test_pool_multiple_connections(db_pool):
     """Test acquiring multiple connections from pool."""
-    # Arrange
-    settings = get_settings()
-    pool = await create_pool(settings)
+    # Act - acquire multiple connections
+    conn1 = await db_pool.acquire()
+    conn2 = await db_pool.acquire()
     
     try:
-        # Act - acquire multiple connections
-        conn1 = await pool.acquire()
-        conn2 = await pool.acquire()
-        
         # Assert
         assert conn1 is not None
         assert conn2 is not None
@@ -90,11 +66,7 @@ async def test_pool_multiple_connections():
         
         assert result1 == 1
         assert result2 == 2
-        
-        # Release connections
-        await pool.release(conn1)
-        await pool.release(conn2)
     finally:
-        # Cleanup
-        await close_pool(pool)
-
+        # Release connections
+        await db_pool.release(conn1)
+        await db_pool.release(conn2)
@@ -0,0 +1,34 @@
+"""Shared helpers for integration tests."""
+
+
+class _AcquireConnection:
+    """Result of ``SingleConnectionPool.acquire()``: awaitable and async context manager."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __await__(self):
+        yield from ()
+        return self._conn
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class SingleConnectionPool:
+    """Pool stand-in that always hands out the same connection.
+
+    Lets repositories (which take a pool) run inside the test's transaction.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def acquire(self) -> _AcquireConnection:
+        return _AcquireConnection(self._conn)
+
+    async def release(self, conn) -> None:
+        pass
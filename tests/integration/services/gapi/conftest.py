@@ -0,0 +1,39 @@
+"""Shared fixtures for GAPI integration tests."""
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from gapi.main import app
+from gapi.clients.pulse_client import PulseClient
+from shared.observability.middleware import ContextMiddleware
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Session-wide async client calling the GAPI app in-process via ASGITransport.
+
+    ASGITransport does not run the lifespan, so the Pulse client it would build
+    is set here; tests that reach Pulse override ``get_pulse_client``.
+    """
+    app.state.pulse_client = PulseClient("http://pulse.test")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def mini_app():
+    """Fresh app with GAPI's ContextMiddleware and no routes.
+
+    Tests that need ad-hoc endpoints register them here instead of on the
+    shared GAPI app, so its router does not grow across tests.
+    """
+    mini = FastAPI()
+    mini.add_middleware(ContextMiddleware, service_name="gapi")
+    return mini
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def mini_client(mini_app):
+    """Async client for the per-test ``mini_app``."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=mini_app), base_url="http://test") as c:
+        yield c
@@ -1,26 +1,22 @@
 """Integration tests for GAPI endpoints"""
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+import pytest
 
-from fastapi.testclient import TestClient
-from gapi.main import app
+# All tests share the session-scoped ASGITransport client from conftest.py
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-client = TestClient(app)
 
-
-def test_health_endpoint_success():
+async def test_health_endpoint_success(client):
     """Test health endpoint returns 200 OK"""
     # Act
-    response = client.get("/health")
+    response = await client.get("/health")
     
     # Assert
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
 
 
-def test_health_endpoint_includes_tracing_headers():
+async def test_health_endpoint_includes_tracing_headers(client):
     """Test health endpoint returns tracing headers"""
     # Arrange
     headers = {
@@ -29,7 +25,7 @@ def test_health_endpoint_includes_tracing_headers():
     }
     
     # Act
-    response = client.get("/health", headers=headers)
+    response = await client.get("/health", headers=headers)
     
     # Assert
     assert response.status_code == 200
@@ -39,10 +35,10 @@ def test_health_endpoint_includes_tracing_headers():
     assert response.headers["X-Trace-Id"] == "t-test456"
 
 
-def test_health_endpoint_generates_tracing_headers_when_missing():
+async def test_health_endpoint_generates_tracing_headers_when_missing(client):
     """Test health endpoint generates tracing headers if not provided"""
     # Act
-    response = client.get("/health")
+    response = await client.get("/health")
 
     # Assert
     assert response.status_code == 200
@@ -54,17 +50,17 @@ def test_health_endpoint_generates_tracing_headers_when_missing():
     assert len(response.headers["X-Trace-Id"]) == 23
 
 
-def test_hello_endpoint_success():
+async def test_hello_endpoint_success(client):
     """Test hello endpoint returns correct message"""
     # Act
-    response = client.get("/api/hello")
+    response = await client.get("/api/hello")
     
     # Assert
     assert response.status_code == 200
     assert response.json() == {"message": "Hello from GAPI"}
 
 
-def test_hello_endpoint_includes_tracing_headers():
+async def test_hello_endpoint_includes_tracing_headers(client):
     """Test hello endpoint propagates tracing headers"""
     # Arrange
     headers = {
@@ -73,7 +69,7 @@ def test_hello_endpoint_includes_tracing_headers():
     }
     
     # Act
-    response = client.get("/api/hello", headers=headers)
+    response = await client.get("/api/hello", headers=headers)
     
     # Assert
     assert response.status_code == 200
@@ -82,31 +78,31 @@ def test_hello_endpoint_includes_tracing_headers():
     assert "message" in response.json()
 
 
-def test_hello_endpoint_content_type():
+async def test_hello_endpoint_content_type(client):
     """Test hello endpoint returns JSON content type"""
     # Act
-    response = client.get("/api/hello")
+    response = await client.get("/api/hello")
 
     # Assert
     assert response.status_code == 200
     assert "application/json" in response.headers["content-type"]
 
 
-def test_trace_source_includes_method_and_path():
+async def test_trace_source_includes_method_and_path(mini_app, mini_client):
     """Test trace_source and request_source include HTTP method and path"""
     # Arrange
     from fastapi import Request
 
     captured_context = None
 
-    @app.get("/test/source")
+    @mini_app.get("/test/source")
     def test_source_endpoint(request: Request):
         nonlocal captured_context
         captured_context = request.state.context
         return {"ok": True}
 
     # Act
-    response = client.get("/test/source")
+    response = await mini_client.get("/test/source")
 
     # Assert
     assert response.status_code == 200
@@ -115,7 +111,7 @@ def test_trace_source_includes_method_and_path():
     assert captured_context.request_source == "GAPI:GET/test/source"
 
 
-def test_trace_source_distinguishes_http_methods():
+async def test_trace_source_distinguishes_http_methods(mini_app, mini_client):
     """Test trace_source differentiates between GET and POST on same path"""
     # Arrange
     from fastapi import Request
@@ -123,21 +119,21 @@ def test_trace_source_distinguishes_http_methods():
     get_context = None
     post_context = None
 
-    @app.get("/test/method")
+    @mini_app.get("/test/method")
     def test_get_endpoint(request: Request):
         nonlocal get_context
         get_context = request.state.context
         return {"method": "GET"}
 
-    @app.post("/test/method")
+    @mini_app.post("/test/method")
     def test_post_endpoint(request: Request):
         nonlocal post_context
         post_context = request.state.context
         return {"method": "POST"}
 
     # Act
-    get_response = client.get("/test/method")
-    post_response = client.post("/test/method", json={})
+    get_response = await mini_client.get("/test/method")
+    post_response = await mini_client.post("/test/method", json={})
 
     # Assert
     assert get_response.status_code == 200
@@ -146,14 +142,14 @@ def test_trace_source_distinguishes_http_methods():
     assert post_context.trace_source == "GAPI:POST/test/method"
 
 
-def test_trace_source_preserved_from_header():
+async def test_trace_source_preserved_from_header(mini_app, mini_client):
     """Test trace_source is preserved from X-Trace-Source header"""
     # Arrange
     from fastapi import Request
 
     captured_context = None
 
-    @app.get("/test/propagation")
+    @mini_app.get("/test/propagation")
     def test_propagation_endpoint(request: Request):
         nonlocal captured_context
         captured_context = request.state.context
@@ -164,7 +160,7 @@ def test_trace_source_preserved_from_header():
     }
 
     # Act
-    response = client.get("/test/propagation", headers=headers)
+    response = await mini_client.get("/test/propagation", headers=headers)
 
     # Assert
     assert response.status_code == 200
@@ -1,129 +1,78 @@
 """Integration tests for GAPI orders API."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 import pytest
-from unittest.mock import AsyncMock, patch
-from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 from gapi.main import app
+from gapi.api.orders import get_pulse_client
 from gapi.models.orders import OrderResponse
 
-client = TestClient(app)
-
-
-@pytest.mark.asyncio
-async def test_create_order_missing_auth():
-    """Test that missing auth token returns 401."""
-    # Arrange
-    order_data = {
-        "order_unique_key": "ouk_test123",
-        "instrument": "NSE:RELIANCE",
-        "side": "BUY",
-        "total_quantity": 100,
-        "split_config": {
-            "num_splits": 5,
-            "duration_minutes": 60,
-            "randomize": True
-        }
+# All tests share the session-scoped ASGITransport client from conftest.py
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+HEADERS = {"Authorization": "Bearer test_token"}
+
+# Valid order payload; tests derive variants with PEP 584 dict merges
+BASE_ORDER = {
+    "order_unique_key": "ouk_test123",
+    "instrument": "NSE:RELIANCE",
+    "side": "BUY",
+    "total_quantity": 100,
+    "split_config": {
+        "num_splits": 5,
+        "duration_minutes": 60,
+        "randomize": True
     }
-    
+}
+
+# Built once per module; the fixture below resets it after each use
+_MOCK_PULSE = AsyncMock()
+_MOCK_PULSE.create_order.return_value = OrderResponse(
+    order_id="ord1234567890abcdef",
+    order_unique_key="ouk_test123"
+)
+
+
+@pytest.fixture
+def mock_pulse_client():
+    """Serve _MOCK_PULSE as the PulseClient dependency for one test."""
+    app.dependency_overrides[get_pulse_client] = lambda: _MOCK_PULSE
+    try:
+        yield _MOCK_PULSE
+    finally:
+        app.dependency_overrides.pop(get_pulse_client, None)
+        _MOCK_PULSE.reset_mock()
+
+
+@pytest.mark.parametrize("order_data,headers,expected_status,expected_code", [
+    pytest.param(BASE_ORDER, None, 401, "UNAUTHORIZED", id="missing_auth"),
+    # Missing exchange prefix - Pydantic validation error
+    pytest.param(BASE_ORDER | {"instrument": "RELIANCE"}, HEADERS, 422, None, id="invalid_instrument"),
+    # total_quantity < num_splits
+    pytest.param(BASE_ORDER | {"total_quantity": 3}, HEADERS, 400, "INVALID_QUANTITY", id="invalid_quantity"),
+    # num_splits exceeds max of 100 - Pydantic validation error
+    pytest.param(
+        BASE_ORDER | {"split_config": BASE_ORDER["split_config"] | {"num_splits": 150}},
+        HEADERS, 422, None, id="invalid_split_config"
+    ),
+])
+async def test_create_order_rejected(client, order_data, headers, expected_status, expected_code):
+    """Test that invalid order requests are rejected before reaching Pulse."""
     # Act
-    response = client.post("/api/orders", json=order_data)
-    
-    # Assert
-    assert response.status_code == 401
-    data = response.json()
-    assert "detail" in data
-    error_detail = data["detail"]
-    assert error_detail["error"]["code"] == "UNAUTHORIZED"
-
-
-@pytest.mark.asyncio
-async def test_create_order_invalid_instrument():
-    """Test that invalid instrument format returns 400."""
-    # Arrange
-    order_data = {
-        "order_unique_key": "ouk_test123",
-        "instrument": "RELIANCE",  # Missing exchange prefix
-        "side": "BUY",
-        "total_quantity": 100,
-        "split_config": {
-            "num_splits": 5,
-            "duration_minutes": 60,
-            "randomize": True
-        }
-    }
-    
-    headers = {"Authorization": "Bearer test_token"}
-    
-    # Act
-    response = client.post("/api/orders", json=order_data, headers=headers)
-    
-    # Assert
-    assert response.status_code == 422  # Pydantic validation error
-
+    response = await client.post("/api/orders", json=order_data, headers=headers)
 
-@pytest.mark.asyncio
-async def test_create_order_invalid_quantity():
-    """Test that total_quantity < num_splits returns 400."""
-    # Arrange
-    order_data = {
-        "order_unique_key": "ouk_test123",
-        "instrument": "NSE:RELIANCE",
-        "side": "BUY",
-        "total_quantity": 3,
-        "split_config": {
-            "num_splits": 5,
-            "duration_minutes": 60,
-            "randomize": True
-        }
-    }
-    
-    headers = {"Authorization": "Bearer test_token"}
-    
-    # Act
-    response = client.post("/api/orders", json=order_data, headers=headers)
-    
     # Assert
-    assert response.status_code == 400
-    data = response.json()
-    assert "detail" in data
-    error_detail = data["detail"]
-    assert error_detail["error"]["code"] == "INVALID_QUANTITY"
+    assert response.status_code == expected_status
+    if expected_code is not None:
+        assert response.json()["detail"]["error"]["code"] == expected_code
 
 
-@pytest.mark.asyncio
-async def test_create_order_success():
+async def test_create_order_success(client, mock_pulse_client):
     """Test successful order creation."""
     # Arrange
-    order_data = {
-        "order_unique_key": "ouk_test123",
-        "instrument": "NSE:RELIANCE",
-        "side": "BUY",
-        "total_quantity": 100,
-        "split_config": {
-            "num_splits": 5,
-            "duration_minutes": 60,
-            "randomize": True
-        }
-    }
-    
-    headers = {"Authorization": "Bearer test_token"}
-    
-    mock_pulse_response = OrderResponse(
-        order_id="ord1234567890abcdef",
-        order_unique_key="ouk_test123"
-    )
-    
-    mock_pulse_client = AsyncMock()
-    mock_pulse_client.create_order.return_value = mock_pulse_response
+    order_data = BASE_ORDER
     
     # Act
-    with patch('gapi.api.orders.PulseClient', return_value=mock_pulse_client):
-        response = client.post("/api/orders", json=order_data, headers=headers)
+    response = await client.post("/api/orders", json=order_data, headers=HEADERS)
     
     # Assert
     assert response.status_code == 202
@@ -137,28 +86,5 @@ async def test_create_order_success():
     assert "X-Request-Id" in response.headers
     assert "X-Trace-Id" in response.headers
 
-
-@pytest.mark.asyncio
-async def test_create_order_invalid_split_config():
-    """Test that invalid split config returns 422."""
-    # Arrange
-    order_data = {
-        "order_unique_key": "ouk_test123",
-        "instrument": "NSE:RELIANCE",
-        "side": "BUY",
-        "total_quantity": 100,
-        "split_config": {
-            "num_splits": 150,  # Exceeds max of 100
-            "duration_minutes": 60,
-            "randomize": True
-        }
-    }
-    
-    headers = {"Authorization": "Bearer test_token"}
-    
-    # Act
-    response = client.post("/api/orders", json=order_data, headers=headers)
-    
-    # Assert
-    assert response.status_code == 422  # Pydantic validation error
+    mock_pulse_client.create_order.assert_awaited_once()
 
@@ -0,0 +1,47 @@
+"""Shared fixtures for Pulse integration tests."""
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from pulse.main import app
+from pulse.api.orders import get_db_pool
+from shared.observability.middleware import ContextMiddleware
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Session-wide async client calling the Pulse app in-process via ASGITransport."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def mini_app():
+    """Fresh app with Pulse's ContextMiddleware and no routes.
+
+    Tests that need ad-hoc endpoints register them here instead of on the
+    shared Pulse app, so its router does not grow across tests.
+    """
+    mini = FastAPI()
+    mini.add_middleware(ContextMiddleware, service_name="pulse")
+    return mini
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def mini_client(mini_app):
+    """Async client for the per-test ``mini_app``."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=mini_app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def app_db_pool(db_pool):
+    """Serve the session DB pool to the app's routes.
+
+    ASGITransport does not run the lifespan that normally creates the pool.
+    """
+    app.dependency_overrides[get_db_pool] = lambda: db_pool
+    try:
+        yield db_pool
+    finally:
+        app.dependency_overrides.pop(get_db_pool, None)
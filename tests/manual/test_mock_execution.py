@@ -9,8 +9,11 @@ Usage:
     python tests/manual/test_mock_execution.py
 """
 
+import io
 import sys
 import asyncio
+import traceback
+from functools import partial
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -20,13 +23,22 @@ from decimal import Decimal
 from pulse.brokers.zerodha_client import ZerodhaClient, ZerodhaOrderRequest
 from shared.observability.context import RequestContext, generate_trace_id, generate_request_id
 
+# One context for the whole run; RequestContext is immutable
+_CTX = RequestContext(
+    trace_id=generate_trace_id(),
+    trace_source="TEST:manual",
+    request_id=generate_request_id(),
+    request_source="TEST:manual",
+    span_source="TEST:manual"
+)
+
 
 @pytest.mark.asyncio
-async def test_market_order():
+async def test_market_order(log=print):
     """Test market order execution (completes immediately)."""
-    print("\n" + "="*60)
-    print("TEST 1: Market Order (Success)")
-    print("="*60)
+    log("\n" + "="*60)
+    log("TEST 1: Market Order (Success)")
+    log("="*60)
     
     client = ZerodhaClient(
         api_key="test_key",
@@ -35,14 +47,6 @@ async def test_market_order():
         mock_scenario="success"
     )
     
-    ctx = RequestContext(
-        trace_id=generate_trace_id(),
-        trace_source="TEST:manual",
-        request_id=generate_request_id(),
-        request_source="TEST:manual",
-        span_source="TEST:manual"
-    )
-    
     # Place market order
     request = ZerodhaOrderRequest(
         instrument="NSE:RELIANCE",
@@ -51,24 +55,24 @@ async def test_market_order():
         order_type="MARKET"
     )
     
-    response = await client.place_order(request, ctx)
+    response = await client.place_order(request, _CTX)
     
-    print(f"✓ Order placed: {response.broker_order_id}")
-    print(f"  Status: {response.status}")
-    print(f"  Filled: {response.filled_quantity}/{request.quantity}")
-    print(f"  Price: ₹{response.average_price}")
+    log(f"✓ Order placed: {response.broker_order_id}")
+    log(f"  Status: {response.status}")
+    log(f"  Filled: {response.filled_quantity}/{request.quantity}")
+    log(f"  Price: ₹{response.average_price}")
     
     assert response.status == "COMPLETE"
     assert response.filled_quantity == 100
-    print("\n✓ Market order test PASSED\n")
+    log("\n✓ Market order test PASSED\n")
 
 
 @pytest.mark.asyncio
-async def test_limit_order_with_polling():
+async def test_limit_order_with_polling(log=print):
     """Test limit order with progressive filling."""
-    print("\n" + "="*60)
-    print("TEST 2: Limit Order (Progressive Fill)")
-    print("="*60)
+    log("\n" + "="*60)
+    log("TEST 2: Limit Order (Progressive Fill)")
+    log("="*60)
     
     client = ZerodhaClient(
         api_key="test_key",
@@ -77,14 +81,6 @@ async def test_limit_order_with_polling():
         mock_scenario="success"
     )
     
-    ctx = RequestContext(
-        trace_id=generate_trace_id(),
-        trace_source="TEST:manual",
-        request_id=generate_request_id(),
-        request_source="TEST:manual",
-        span_source="TEST:manual"
-    )
-    
     # Place limit order
     request = ZerodhaOrderRequest(
         instrument="NSE:RELIANCE",
@@ -94,39 +90,39 @@ async def test_limit_order_with_polling():
         limit_price=Decimal("1240.00")
     )
     
-    response = await client.place_order(request, ctx)
+    response = await client.place_order(request, _CTX)
     broker_order_id = response.broker_order_id
     
-    print(f"✓ Order placed: {broker_order_id}")
-    print(f"  Status: {response.status}")
-    print(f"  Filled: {response.filled_quantity}/{request.quantity}")
+    log(f"✓ Order placed: {broker_order_id}")
+    log(f"  Status: {response.status}")
+    log(f"  Filled: {response.filled_quantity}/{request.quantity}")
     
-    # Poll for status updates
+    # Poll for status updates. The mock advances per poll, not per second,
+    # so there is no need to sleep between polls
     for poll_num in range(1, 5):
-        await asyncio.sleep(1)  # Simulate 5-second polling interval
-        status = await client.get_order_status(broker_order_id, ctx)
+        status = await client.get_order_status(broker_order_id, _CTX)
         
-        print(f"\nPoll #{poll_num}:")
-        print(f"  Status: {status.status}")
-        print(f"  Filled: {status.filled_quantity}/{request.quantity}")
+        log(f"\nPoll #{poll_num}:")
+        log(f"  Status: {status.status}")
+        log(f"  Filled: {status.filled_quantity}/{request.quantity}")
         if status.average_price:
-            print(f"  Price: ₹{status.average_price}")
+            log(f"  Price: ₹{status.average_price}")
         
         if status.status == "COMPLETE":
-            print(f"\n✓ Order completed after {poll_num} polls")
+            log(f"\n✓ Order completed after {poll_num} polls")
             break
     
     assert status.status == "COMPLETE"
     assert status.filled_quantity == 100
-    print("\n✓ Limit order test PASSED\n")
+    log("\n✓ Limit order test PASSED\n")
 
 
 @pytest.mark.asyncio
-async def test_partial_fill_scenario():
+async def test_partial_fill_scenario(log=print):
     """Test partial fill scenario."""
-    print("\n" + "="*60)
-    print("TEST 3: Partial Fill Scenario")
-    print("="*60)
+    log("\n" + "="*60)
+    log("TEST 3: Partial Fill Scenario")
+    log("="*60)
     
     client = ZerodhaClient(
         api_key="test_key",
@@ -135,14 +131,6 @@ async def test_partial_fill_scenario():
         mock_scenario="partial_fill"
     )
     
-    ctx = RequestContext(
-        trace_id=generate_trace_id(),
-        trace_source="TEST:manual",
-        request_id=generate_request_id(),
-        request_source="TEST:manual",
-        span_source="TEST:manual"
-    )
-    
     request = ZerodhaOrderRequest(
         instrument="NSE:RELIANCE",
         side="BUY",
@@ -151,22 +139,22 @@ async def test_partial_fill_scenario():
         limit_price=Decimal("1240.00")
     )
     
-    response = await client.place_order(request, ctx)
+    response = await client.place_order(request, _CTX)
     
-    print(f"✓ Order placed: {response.broker_order_id}")
-    print(f"  Status: {response.status}")
-    print(f"  Filled: {response.filled_quantity}/{request.quantity} (50% partial fill)")
+    log(f"✓ Order placed: {response.broker_order_id}")
+    log(f"  Status: {response.status}")
+    log(f"  Filled: {response.filled_quantity}/{request.quantity} (50% partial fill)")
     
     assert response.filled_quantity == 50
-    print("\n✓ Partial fill test PASSED\n")
+    log("\n✓ Partial fill test PASSED\n")
 
 
 @pytest.mark.asyncio
-async def test_rejection_scenario():
+async def test_rejection_scenario(log=print):
     """Test broker rejection scenario."""
-    print("\n" + "="*60)
-    print("TEST 4: Broker Rejection Scenario")
-    print("="*60)
+    log("\n" + "="*60)
+    log("TEST 4: Broker Rejection Scenario")
+    log("="*60)
     
     client = ZerodhaClient(
         api_key="test_key",
@@ -175,14 +163,6 @@ async def test_rejection_scenario():
         mock_scenario="rejection"
     )
     
-    ctx = RequestContext(
-        trace_id=generate_trace_id(),
-        trace_source="TEST:manual",
-        request_id=generate_request_id(),
-        request_source="TEST:manual",
-        span_source="TEST:manual"
-    )
-    
     request = ZerodhaOrderRequest(
         instrument="NSE:RELIANCE",
         side="BUY",
@@ -191,44 +171,59 @@ async def test_rejection_scenario():
     )
     
     try:
-        response = await client.place_order(request, ctx)
-        print("✗ Expected rejection but order succeeded")
+        response = await client.place_order(request, _CTX)
+        log("✗ Expected rejection but order succeeded")
         assert False
     except Exception as e:
-        print(f"✓ Order rejected as expected: {str(e)}")
+        log(f"✓ Order rejected as expected: {str(e)}")
         assert "INSUFFICIENT_FUNDS" in str(e)
     
-    print("\n✓ Rejection test PASSED\n")
+    log("\n✓ Rejection test PASSED\n")
 
 
 async def main():
-    """Run all manual tests."""
+    """Run all manual tests concurrently.
+
+    The tests are independent (separate mock clients), so they run under
+    asyncio.gather. Each writes to its own buffer, printed in order once all
+    have finished, so their output does not interleave.
+    """
     print("\n" + "="*60)
     print("MOCK EXECUTION FLOW TESTS")
     print("="*60)
     print("\nThese tests demonstrate order execution without real broker.")
     print("All tests use mock Zerodha client with different scenarios.\n")
     
-    try:
-        await test_market_order()
-        await test_limit_order_with_polling()
-        await test_partial_fill_scenario()
-        await test_rejection_scenario()
-        
-        print("\n" + "="*60)
-        print("ALL TESTS PASSED ✓")
-        print("="*60 + "\n")
-        
-    except AssertionError as e:
-        print(f"\n✗ TEST FAILED: {e}\n")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n✗ UNEXPECTED ERROR: {e}\n")
-        import traceback
-        traceback.print_exc()
+    tests = [
+        test_market_order,
+        test_limit_order_with_polling,
+        test_partial_fill_scenario,
+        test_rejection_scenario
+    ]
+    buffers = [io.StringIO() for _ in tests]
+    results = await asyncio.gather(
+        *(test(log=partial(print, file=buf)) for test, buf in zip(tests, buffers)),
+        return_exceptions=True
+    )
+    
+    failed = False
+    for buf, result in zip(buffers, results):
+        print(buf.getvalue(), end="")
+        if isinstance(result, AssertionError):
+            print(f"\n✗ TEST FAILED: {result}\n")
+            failed = True
+        elif isinstance(result, Exception):
+            print(f"\n✗ UNEXPECTED ERROR: {result}\n")
+            traceback.print_exception(result)
+            failed = True
+    
+    if failed:
         sys.exit(1)
+    
+    print("\n" + "="*60)
+    print("ALL TESTS PASSED ✓")
+    print("="*60 + "\n")
 
 
 if __name__ == "__main__":
     asyncio.run(main())
-
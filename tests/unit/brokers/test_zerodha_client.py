@@ -5,9 +5,9 @@ from pulse.brokers.zerodha_client import ZerodhaClient, ZerodhaOrderRequest, Zer
 from shared.observability.context import RequestContext
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def request_context():
-    """Create a test request context."""
+    """Create a test request context, shared by all tests since it is immutable."""
     return RequestContext(
         trace_id="t1234567890abcdef1234",
         trace_source="TEST:test",
@@ -17,9 +17,9 @@ def request_context():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def zerodha_client():
-    """Create ZerodhaClient instance in mock mode."""
+    """Create one ZerodhaClient instance in mock mode for the module."""
     return ZerodhaClient(
         api_key="test_api_key",
         access_token="test_access_token",
@@ -27,6 +27,13 @@ def zerodha_client():
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_orders(zerodha_client):
+    """Forget mock orders placed by earlier tests on the shared client."""
+    yield
+    zerodha_client._mock_order_states.clear()
+
+
 @pytest.mark.asyncio
 async def test_place_market_order_success(zerodha_client, request_context):
     """Test placing a market order successfully (mock mode)."""
@@ -113,8 +120,7 @@ async def test_cancel_order_success(zerodha_client, request_context):
     assert response.message == "Order cancelled successfully"
 
 
-@pytest.mark.asyncio
-async def test_zerodha_order_request_validation():
+def test_zerodha_order_request_validation():
     """Test ZerodhaOrderRequest validation."""
     # Valid market order
     market_order = ZerodhaOrderRequest(
@@ -1,24 +1,43 @@
 """Unit tests for BrokerEventRepository."""
 import pytest
 import asyncpg
-from datetime import datetime, timezone
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from pulse.repositories.broker_event_repository import BrokerEventRepository
 from shared.observability.context import RequestContext
 
 
-@pytest.fixture
-def mock_pool():
-    """Create a mock connection pool."""
-    return MagicMock(spec=asyncpg.Pool)
+class _FakeConn:
+    """Minimal stand-in for asyncpg.Connection; tests set fetchrow's result."""
+
+    def __init__(self):
+        self.fetchrow = AsyncMock()
+
+
+class _FakePool:
+    """Minimal stand-in for asyncpg.Pool that hands out a single connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.released = []
+
+    async def acquire(self):
+        return self.conn
+
+    async def release(self, conn):
+        self.released.append(conn)
 
 
 @pytest.fixture
 def mock_conn():
-    """Create a mock database connection."""
-    conn = AsyncMock(spec=asyncpg.Connection)
-    return conn
+    """Create a fake database connection."""
+    return _FakeConn()
+
+
+@pytest.fixture
+def mock_pool(mock_conn):
+    """Create a fake connection pool serving mock_conn."""
+    return _FakePool(mock_conn)
 
 
 @pytest.fixture
@@ -39,129 +58,60 @@ def broker_event_repository(mock_pool):
     return BrokerEventRepository(mock_pool)
 
 
-@pytest.mark.asyncio
-async def test_create_broker_event_place_order_success(broker_event_repository, mock_pool, mock_conn, request_context):
-    """Test creating a successful PLACE_ORDER broker event."""
-    # Arrange
-    mock_pool.acquire = AsyncMock(return_value=mock_conn)
-    mock_pool.release = AsyncMock()
-    
-    expected_event = {
-        'id': 'evt_123',
-        'execution_id': 'exec_123',
-        'slice_id': 'slice_123',
+_OPTIONAL_COLUMNS = {
+    'broker_order_id', 'request_method', 'request_endpoint', 'request_payload',
+    'response_status_code', 'response_body', 'response_time_ms', 'broker_status',
+    'broker_message', 'filled_quantity', 'pending_quantity', 'average_price',
+    'error_code', 'error_message',
+}
+
+
+def _inserted_row(conn):
+    """Map the INSERT's column list onto the values bound to fetchrow."""
+    conn.fetchrow.assert_awaited_once()
+    query, *params = conn.fetchrow.call_args.args
+    assert 'INSERT INTO order_slice_broker_events' in query
+    columns = query.split('(', 1)[1].split(')', 1)[0]
+    names = [name.strip() for name in columns.split(',')]
+    assert len(names) == len(params)
+    return dict(zip(names, params))
+
+
+_BASE_EVENT = {
+    'execution_id': 'exec_123',
+    'slice_id': 'slice_123',
+    'attempt_number': 1,
+    'attempt_id': 'attempt-abc',
+    'executor_id': 'worker-1',
+    'broker_name': 'zerodha'
+}
+
+
+@pytest.mark.parametrize("event_kwargs", [
+    pytest.param(_BASE_EVENT | {
+        'event_id': 'evt_123',
         'event_sequence': 1,
         'event_type': 'PLACE_ORDER',
-        'attempt_number': 1,
-        'attempt_id': 'attempt-abc',
-        'executor_id': 'worker-1',
-        'broker_name': 'zerodha',
         'is_success': True,
         'broker_order_id': 'ZH240101abc123',
         'broker_status': 'COMPLETE',
         'filled_quantity': 100,
         'average_price': Decimal('1250.50'),
         'response_time_ms': 250
-    }
-    mock_conn.fetchrow = AsyncMock(return_value=expected_event)
-    
-    # Act
-    result = await broker_event_repository.create_broker_event(
-        event_id='evt_123',
-        execution_id='exec_123',
-        slice_id='slice_123',
-        event_sequence=1,
-        event_type='PLACE_ORDER',
-        attempt_number=1,
-        attempt_id='attempt-abc',
-        executor_id='worker-1',
-        broker_name='zerodha',
-        is_success=True,
-        broker_order_id='ZH240101abc123',
-        broker_status='COMPLETE',
-        filled_quantity=100,
-        average_price=Decimal('1250.50'),
-        response_time_ms=250,
-        ctx=request_context
-    )
-    
-    # Assert
-    assert result == expected_event
-    assert result['event_type'] == 'PLACE_ORDER'
-    assert result['is_success'] is True
-    assert result['broker_order_id'] == 'ZH240101abc123'
-    mock_conn.fetchrow.assert_called_once()
-    mock_pool.release.assert_called_once_with(mock_conn)
-
-
-@pytest.mark.asyncio
-async def test_create_broker_event_place_order_failure(broker_event_repository, mock_pool, mock_conn, request_context):
-    """Test creating a failed PLACE_ORDER broker event."""
-    # Arrange
-    mock_pool.acquire = AsyncMock(return_value=mock_conn)
-    mock_pool.release = AsyncMock()
-    
-    expected_event = {
-        'id': 'evt_124',
-        'execution_id': 'exec_123',
-        'slice_id': 'slice_123',
+    }, id="place_order_success"),
+    pytest.param(_BASE_EVENT | {
+        'event_id': 'evt_124',
         'event_sequence': 1,
         'event_type': 'PLACE_ORDER',
-        'attempt_number': 1,
-        'attempt_id': 'attempt-abc',
-        'executor_id': 'worker-1',
-        'broker_name': 'zerodha',
         'is_success': False,
         'error_code': 'INSUFFICIENT_FUNDS',
         'error_message': 'Insufficient margin available',
         'response_time_ms': 180
-    }
-    mock_conn.fetchrow = AsyncMock(return_value=expected_event)
-    
-    # Act
-    result = await broker_event_repository.create_broker_event(
-        event_id='evt_124',
-        execution_id='exec_123',
-        slice_id='slice_123',
-        event_sequence=1,
-        event_type='PLACE_ORDER',
-        attempt_number=1,
-        attempt_id='attempt-abc',
-        executor_id='worker-1',
-        broker_name='zerodha',
-        is_success=False,
-        error_code='INSUFFICIENT_FUNDS',
-        error_message='Insufficient margin available',
-        response_time_ms=180,
-        ctx=request_context
-    )
-    
-    # Assert
-    assert result == expected_event
-    assert result['is_success'] is False
-    assert result['error_code'] == 'INSUFFICIENT_FUNDS'
-    assert result['error_message'] == 'Insufficient margin available'
-    mock_conn.fetchrow.assert_called_once()
-    mock_pool.release.assert_called_once_with(mock_conn)
-
-
-@pytest.mark.asyncio
-async def test_create_broker_event_status_poll(broker_event_repository, mock_pool, mock_conn, request_context):
-    """Test creating a STATUS_POLL broker event."""
-    # Arrange
-    mock_pool.acquire = AsyncMock(return_value=mock_conn)
-    mock_pool.release = AsyncMock()
-
-    expected_event = {
-        'id': 'evt_125',
-        'execution_id': 'exec_123',
-        'slice_id': 'slice_123',
+    }, id="place_order_failure"),
+    pytest.param(_BASE_EVENT | {
+        'event_id': 'evt_125',
         'event_sequence': 2,
         'event_type': 'STATUS_POLL',
-        'attempt_number': 1,
-        'attempt_id': 'attempt-abc',
-        'executor_id': 'worker-1',
-        'broker_name': 'zerodha',
         'is_success': True,
         'broker_order_id': 'ZH240101abc123',
         'broker_status': 'COMPLETE',
@@ -169,97 +119,63 @@ async def test_create_broker_event_status_poll(broker_event_repository, mock_poo
         'pending_quantity': 0,
         'average_price': Decimal('1250.50'),
         'response_time_ms': 120
-    }
-    mock_conn.fetchrow = AsyncMock(return_value=expected_event)
+    }, id="status_poll"),
+    pytest.param(_BASE_EVENT | {
+        'event_id': 'evt_126',
+        'event_sequence': 3,
+        'event_type': 'CANCEL_REQUEST',
+        'is_success': True,
+        'broker_order_id': 'ZH240101abc123',
+        'broker_status': 'CANCELLED',
+        'response_time_ms': 200
+    }, id="cancel_request"),
+])
+@pytest.mark.asyncio
+async def test_create_broker_event(broker_event_repository, mock_pool, mock_conn, request_context, event_kwargs):
+    """Test each broker event is inserted with every argument bound to its own column."""
+    # Arrange
+    mock_conn.fetchrow.return_value = {'id': event_kwargs['event_id']}
 
     # Act
-    result = await broker_event_repository.create_broker_event(
-        event_id='evt_125',
-        execution_id='exec_123',
-        slice_id='slice_123',
-        event_sequence=2,
-        event_type='STATUS_POLL',
-        attempt_number=1,
-        attempt_id='attempt-abc',
-        executor_id='worker-1',
-        broker_name='zerodha',
-        is_success=True,
-        broker_order_id='ZH240101abc123',
-        broker_status='COMPLETE',
-        filled_quantity=100,
-        pending_quantity=0,
-        average_price=Decimal('1250.50'),
-        response_time_ms=120,
-        ctx=request_context
-    )
+    result = await broker_event_repository.create_broker_event(**event_kwargs, ctx=request_context)
 
     # Assert
-    assert result == expected_event
-    assert result['event_type'] == 'STATUS_POLL'
-    assert result['event_sequence'] == 2
-    assert result['filled_quantity'] == 100
-    assert result['pending_quantity'] == 0
-    mock_conn.fetchrow.assert_called_once()
-    mock_pool.release.assert_called_once_with(mock_conn)
+    row = _inserted_row(mock_conn)
+    assert row['id'] == event_kwargs['event_id']
+    for name, value in event_kwargs.items():
+        if name != 'event_id':
+            assert row[name] == value, name
+    # Optional broker fields not passed are stored as NULL
+    for name in _OPTIONAL_COLUMNS - event_kwargs.keys():
+        assert row[name] is None, name
+    assert row['request_id'] == request_context.request_id
+    assert row['event_timestamp'] == row['created_at'] == row['updated_at']
+    assert row['created_at'].tzinfo is not None
+
+    assert result == {'id': event_kwargs['event_id']}
+    assert mock_pool.released == [mock_conn]
 
 
 @pytest.mark.asyncio
-async def test_create_broker_event_cancel_request(broker_event_repository, mock_pool, mock_conn, request_context):
-    """Test creating a CANCEL_REQUEST broker event."""
+async def test_create_broker_event_without_context(broker_event_repository, mock_conn):
+    """Test that an event created without a request context stores no request_id."""
     # Arrange
-    mock_pool.acquire = AsyncMock(return_value=mock_conn)
-    mock_pool.release = AsyncMock()
-
-    expected_event = {
-        'id': 'evt_126',
-        'execution_id': 'exec_123',
-        'slice_id': 'slice_123',
-        'event_sequence': 3,
-        'event_type': 'CANCEL_REQUEST',
-        'attempt_number': 1,
-        'attempt_id': 'attempt-abc',
-        'executor_id': 'worker-1',
-        'broker_name': 'zerodha',
-        'is_success': True,
-        'broker_order_id': 'ZH240101abc123',
-        'broker_status': 'CANCELLED',
-        'response_time_ms': 200
-    }
-    mock_conn.fetchrow = AsyncMock(return_value=expected_event)
+    mock_conn.fetchrow.return_value = {'id': 'evt_123'}
 
     # Act
-    result = await broker_event_repository.create_broker_event(
-        event_id='evt_126',
-        execution_id='exec_123',
-        slice_id='slice_123',
-        event_sequence=3,
-        event_type='CANCEL_REQUEST',
-        attempt_number=1,
-        attempt_id='attempt-abc',
-        executor_id='worker-1',
-        broker_name='zerodha',
-        is_success=True,
-        broker_order_id='ZH240101abc123',
-        broker_status='CANCELLED',
-        response_time_ms=200,
-        ctx=request_context
+    await broker_event_repository.create_broker_event(
+        **_BASE_EVENT, event_id='evt_123', event_sequence=1, event_type='PLACE_ORDER', is_success=True
     )
 
     # Assert
-    assert result == expected_event
-    assert result['event_type'] == 'CANCEL_REQUEST'
-    assert result['broker_status'] == 'CANCELLED'
-    mock_conn.fetchrow.assert_called_once()
-    mock_pool.release.assert_called_once_with(mock_conn)
+    assert _inserted_row(mock_conn)['request_id'] is None
 
 
 @pytest.mark.asyncio
 async def test_connection_released_on_error(broker_event_repository, mock_pool, mock_conn, request_context):
     """Test that connection is released even when an error occurs."""
     # Arrange
-    mock_pool.acquire = AsyncMock(return_value=mock_conn)
-    mock_pool.release = AsyncMock()
-    mock_conn.fetchrow = AsyncMock(side_effect=asyncpg.PostgresError("Database error"))
+    mock_conn.fetchrow.side_effect = asyncpg.PostgresError("Database error")
 
     # Act & Assert
     with pytest.raises(asyncpg.PostgresError):
@@ -278,5 +194,5 @@ async def test_connection_released_on_error(broker_event_repository, mock_pool,
         )
 
     # Connection should still be released
-    mock_pool.release.assert_called_once_with(mock_conn)
+    assert mock_pool.released == [mock_conn]
 
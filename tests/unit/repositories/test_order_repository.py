@@ -157,3 +157,39 @@ async def test_update_order_status_success(order_repository, mock_pool, mock_con
     mock_conn.execute.assert_called_once()
     mock_pool.release.assert_called_once_with(mock_conn)
 
+
+@pytest.mark.asyncio
+async def test_get_pending_orders_returns_claimed_rows_in_order(order_repository, mock_pool, mock_conn, request_context):
+    """Test that claimed rows come back as dicts, in the order the claim query returns them."""
+    # Arrange
+    rows = [
+        {'id': 'ord_older', 'order_queue_status': 'IN_PROGRESS'},
+        {'id': 'ord_newer', 'order_queue_status': 'IN_PROGRESS'},
+    ]
+    mock_pool.acquire = AsyncMock(return_value=mock_conn)
+    mock_pool.release = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=rows)
+
+    # Act
+    orders = await order_repository.get_pending_orders(limit=10, ctx=request_context)
+
+    # Assert
+    assert orders == rows
+    assert all(type(order) is dict for order in orders)
+    assert mock_conn.fetch.call_args[0][1] == 10
+    mock_pool.release.assert_called_once_with(mock_conn)
+
+
+@pytest.mark.asyncio
+async def test_get_pending_orders_releases_connection_on_error(order_repository, mock_pool, mock_conn, request_context):
+    """Test that a failed claim re-raises and still releases the connection."""
+    # Arrange
+    mock_pool.acquire = AsyncMock(return_value=mock_conn)
+    mock_pool.release = AsyncMock()
+    mock_conn.fetch = AsyncMock(side_effect=asyncpg.PostgresError("Database error"))
+
+    # Act & Assert
+    with pytest.raises(asyncpg.PostgresError):
+        await order_repository.get_pending_orders(limit=10, ctx=request_context)
+    mock_pool.release.assert_called_once_with(mock_conn)
+
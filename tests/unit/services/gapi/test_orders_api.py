@@ -1,15 +1,11 @@
 """Unit tests for GAPI orders API."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from fastapi import Request, HTTPException
 from shared.observability.context import RequestContext
 from gapi.api.orders import create_order, validate_auth_token
+from pydantic import ValidationError
 from gapi.models.orders import CreateOrderRequest, SplitConfig, OrderResponse
 
 
@@ -44,6 +40,38 @@ def test_validate_auth_token_success():
     validate_auth_token("Bearer valid_token_123")
 
 
+def _order_with_instrument(instrument: str) -> CreateOrderRequest:
+    return CreateOrderRequest(
+        order_unique_key="ouk_test123",
+        instrument=instrument,
+        side="BUY",
+        total_quantity=100,
+        split_config=SplitConfig(num_splits=5, duration_minutes=60, randomize=True)
+    )
+
+
+@pytest.mark.parametrize("instrument", ["NSE:RELIANCE", "BSE:TCS", "NSE:M2M", "NSE:3MINDIA"])
+def test_validate_instrument_accepts_valid(instrument):
+    """Test that well-formed instruments pass validation."""
+    assert _order_with_instrument(instrument).instrument == instrument
+
+
+@pytest.mark.parametrize("instrument,message", [
+    ("RELIANCE", "Expected EXCHANGE:SYMBOL"),
+    ("NSE:REL:X", "Expected EXCHANGE:SYMBOL"),
+    ("NYSE:IBM", "Unsupported exchange: NYSE"),
+    ("NSE:reliance", "alphanumeric and uppercase"),
+    ("NSE:REL-1", "alphanumeric and uppercase"),
+    ("NSE:123", "alphanumeric and uppercase"),
+])
+def test_validate_instrument_rejects_invalid(instrument, message):
+    """Test that malformed instruments fail with a specific message."""
+    with pytest.raises(ValidationError) as exc_info:
+        _order_with_instrument(instrument)
+
+    assert message in str(exc_info.value)
+
+
 @pytest.mark.asyncio
 async def test_create_order_quantity_validation():
     """Test that total_quantity must be >= num_splits."""
@@ -111,8 +139,7 @@ async def test_create_order_success():
     mock_pulse_client.create_order.return_value = mock_pulse_response
     
     # Act
-    with patch('gapi.api.orders.PulseClient', return_value=mock_pulse_client):
-        response = await create_order(request, order_data, "Bearer token123")
+    response = await create_order(request, order_data, "Bearer token123", mock_pulse_client)
     
     # Assert
     assert response.order_id == "ord1234567890abcdef"
@@ -0,0 +1,66 @@
+"""Unit tests for GAPI PulseClient."""
+
+import json
+
+import httpx
+import pytest
+from shared.http import client as client_mod
+from shared.observability.context import RequestContext
+from gapi.clients.pulse_client import PulseClient
+from gapi.models.orders import InternalCreateOrderRequest, SplitConfig
+
+
+@pytest.mark.asyncio
+async def test_create_order_round_trips_json(monkeypatch):
+    """Test that the order is sent as JSON and the response parsed into OrderResponse."""
+    # Arrange
+    captured = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["content_type"] = request.headers["Content-Type"]
+        captured["body"] = json.loads(request.content)
+        return httpx.Response(
+            201, json={"order_id": "ord1234567890abcdef", "order_unique_key": "ouk_test123"}
+        )
+
+    base_url = "http://pulse.test"
+    monkeypatch.setattr(client_mod, "_CLIENTS", {
+        client_mod._client_key(base_url, 30.0): httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(handler))
+    })
+
+    order_data = InternalCreateOrderRequest(
+        order_unique_key="ouk_test123",
+        instrument="NSE:RELIANCE",
+        side="BUY",
+        total_quantity=100,
+        split_config=SplitConfig(num_splits=5, duration_minutes=60, randomize=True)
+    )
+    ctx = RequestContext(
+        trace_id="t1234567890abcdef1234",
+        trace_source="TEST",
+        request_id="r1234567890abcdef1234",
+        request_source="TEST",
+        span_source="TEST"
+    )
+
+    # Act
+    response = await PulseClient(base_url).create_order(order_data, ctx)
+
+    # Assert
+    assert captured["content_type"] == "application/json"
+    assert captured["body"] == order_data.model_dump()
+    assert response.order_id == "ord1234567890abcdef"
+    assert response.order_unique_key == "ouk_test123"
+
+
+def test_pulse_client_requires_base_url(monkeypatch):
+    """Test that a missing PULSE_API_BASE_URL fails when the client is built."""
+    from types import SimpleNamespace
+    from gapi.clients import pulse_client as pulse_client_mod
+
+    monkeypatch.setattr(
+        pulse_client_mod, "get_settings", lambda: SimpleNamespace(pulse_api_base_url=None)
+    )
+
+    with pytest.raises(ValueError, match="PULSE_API_BASE_URL"):
+        PulseClient()
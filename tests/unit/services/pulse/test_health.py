@@ -1,34 +1,43 @@
 """Unit tests for health endpoint"""
-import sys
-from pathlib import Path
+import json
 from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+import pytest
 
 from pulse.main import health
 
 
-def test_health_returns_ok():
+@pytest.mark.asyncio
+async def test_health_returns_ok():
     """Test health endpoint returns status ok"""
     # Arrange
     # (no setup needed)
     
     # Act
-    result = health()
+    result = await health()
     
     # Assert
-    assert result == {"status": "ok"}
-    assert "status" in result
-    assert result["status"] == "ok"
+    assert result.media_type == "application/json"
+    assert json.loads(result.body) == {"status": "ok"}
 
 
+@pytest.mark.asyncio
 @patch('pulse.main.logger')
-def test_health_logs_request(mock_logger):
+async def test_health_logs_request(mock_logger):
     """Test health endpoint logs the request with auto-injected context"""
     # Act
-    result = health()
+    result = await health()
 
     # Assert
     mock_logger.info.assert_called_once_with("Health check")
-    assert result["status"] == "ok"
+    assert json.loads(result.body)["status"] == "ok"
 
+
+@pytest.mark.asyncio
+async def test_health_returns_a_new_response_per_call():
+    """Test health responses are not shared, so headers set on one never leak"""
+    first = await health()
+    second = await health()
+
+    assert first is not second
+    assert first.body == second.body
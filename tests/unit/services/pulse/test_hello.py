@@ -1,10 +1,6 @@
 """Unit tests for hello endpoint"""
-import sys
-from pathlib import Path
 from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 from pulse.main import hello
 
 
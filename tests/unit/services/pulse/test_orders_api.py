@@ -1,10 +1,5 @@
 """Unit tests for Pulse orders API."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import asyncpg
@@ -98,17 +98,8 @@ async def test_process_single_order_success(mock_ctx, sample_order):
     # Verify success
     assert result is True
 
-    # Verify status was updated to IN_PROGRESS
-    # The context should have the parent order's origin trace context
-    assert mock_order_repo.update_order_status.called
-    update_call_args = mock_order_repo.update_order_status.call_args_list[0]
-    assert update_call_args[0][0] == 'order_123'
-    assert update_call_args[0][1] == 'IN_PROGRESS'
-    update_ctx = update_call_args[0][2]
-    assert update_ctx.trace_id == 't1234567890abcdef1234'  # From parent order's origin_trace_id
-    assert update_ctx.trace_source == 'TEST:parent_order'  # From parent order's origin_trace_source
-    assert update_ctx.request_id == 'r1234567890abcdef1234'  # From parent order's origin_request_id
-    assert update_ctx.request_source == 'TEST:parent_order'  # From parent order's origin_request_source
+    # The order was already claimed as IN_PROGRESS, so no extra status update
+    mock_order_repo.update_order_status.assert_not_called()
 
     # Verify slices were created
     assert mock_slice_repo.create_order_slices_batch.called
@@ -0,0 +1 @@
+# Database unit tests
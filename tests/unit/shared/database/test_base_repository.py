@@ -0,0 +1,69 @@
+"""Unit tests for BaseRepository pooled query helpers."""
+import pytest
+import asyncpg
+from unittest.mock import AsyncMock, MagicMock
+from shared.database.base_repository import BaseRepository
+
+
+class _AcquireContext:
+    """Mimic asyncpg's pool acquire context manager."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.released = False
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.released = True
+
+
+@pytest.fixture
+def mock_conn():
+    """Create a mock database connection."""
+    return AsyncMock(spec=asyncpg.Connection)
+
+
+@pytest.fixture
+def acquire_ctx(mock_conn):
+    """Create the acquire context returned by the mock pool."""
+    return _AcquireContext(mock_conn)
+
+
+@pytest.fixture
+def repository(acquire_ctx):
+    """Create BaseRepository with a mock pool."""
+    pool = MagicMock(spec=asyncpg.Pool)
+    pool.acquire = MagicMock(return_value=acquire_ctx)
+    return BaseRepository(pool)
+
+
+@pytest.mark.asyncio
+async def test_fetchrow_releases_connection(repository, mock_conn, acquire_ctx):
+    """Test that fetchrow runs on a pooled connection and releases it."""
+    mock_conn.fetchrow = AsyncMock(return_value={'id': 1})
+
+    result = await repository.fetchrow("SELECT * FROM t WHERE id = $1", 1)
+
+    assert result == {'id': 1}
+    mock_conn.fetchrow.assert_called_once_with("SELECT * FROM t WHERE id = $1", 1)
+    assert acquire_ctx.released
+
+
+@pytest.mark.asyncio
+async def test_execute_releases_connection_on_error(repository, mock_conn, acquire_ctx):
+    """Test that the connection is released even when the query fails."""
+    mock_conn.execute = AsyncMock(side_effect=asyncpg.PostgresError("boom"))
+
+    with pytest.raises(asyncpg.PostgresError):
+        await repository.execute("UPDATE t SET x = 1")
+
+    assert acquire_ctx.released
+
+
+@pytest.mark.asyncio
+async def test_connection_returns_pool_acquire_context(repository, mock_conn):
+    """Test that connection() yields a pooled connection."""
+    async with repository.connection() as conn:
+        assert conn is mock_conn
@@ -0,0 +1,62 @@
+"""Unit tests for connection pool creation and warm-up."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from shared.database import pool as pool_mod
+
+
+class _FakePool:
+    """Minimal stand-in for asyncpg.Pool."""
+
+    def __init__(self, conns):
+        self.conns = list(conns)
+        self.released = []
+        self.close = AsyncMock()
+
+    def get_min_size(self):
+        return len(self.conns)
+
+    async def acquire(self):
+        return self.conns.pop(0)
+
+    async def release(self, conn):
+        self.released.append(conn)
+
+
+def _conn(error=None):
+    conn = MagicMock()
+    conn.execute = AsyncMock(side_effect=error)
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_runs_query_on_each_connection():
+    conns = [_conn(), _conn()]
+    fake = _FakePool(conns)
+
+    await pool_mod.warm_pool(fake)
+
+    for conn in conns:
+        conn.execute.assert_awaited_once_with("SELECT 1")
+    assert fake.released == conns
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_releases_connections_on_failure():
+    conns = [_conn(), _conn(error=OSError("connection reset"))]
+    fake = _FakePool(conns)
+
+    with pytest.raises(OSError):
+        await pool_mod.warm_pool(fake)
+
+    assert fake.released == conns
+
+
+@pytest.mark.asyncio
+async def test_create_pool_closes_pool_when_warm_up_fails(monkeypatch):
+    fake = _FakePool([_conn(error=OSError("connection reset"))])
+    monkeypatch.setattr(pool_mod.asyncpg, "create_pool", AsyncMock(return_value=fake))
+
+    with pytest.raises(OSError):
+        await pool_mod.create_pool(MagicMock())
+
+    fake.close.assert_awaited_once()
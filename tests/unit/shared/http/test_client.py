@@ -1,80 +1,191 @@
 """Unit tests for ContextPropagatingClient header propagation."""
-import types
+import httpx
+import pytest
+import pytest_asyncio
+
+from shared.observability.context import (
+    RequestContext,
+    set_current_context,
+    reset_current_context,
+)
+
+
+@pytest.fixture
+def use_context():
+    """Set a RequestContext as current for the test and reset it afterwards."""
+    tokens = []
+
+    def _use(**fields):
+        values = {
+            "trace_id": "t1",
+            "trace_source": "SVC:GET/x",
+            "request_id": "r1",
+            "request_source": "SVC:GET/x",
+            "span_source": "should_not_be_sent",
+        }
+        values.update(fields)
+        tokens.append(set_current_context(RequestContext(**values)))
+
+    yield _use
+
+    for token in reversed(tokens):
+        reset_current_context(token)
 
 
-def test_add_context_headers_maps_fields_correctly(monkeypatch):
+@pytest_asyncio.fixture
+async def sent(monkeypatch):
+    """Back ContextPropagatingClient with a MockTransport; yields the sent requests."""
     from shared.http import client as client_mod
 
-    # Avoid creating a real httpx.AsyncClient
-    class DummyAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-    monkeypatch.setattr(client_mod.httpx, "AsyncClient", DummyAsyncClient)
-
-    # Stub context
-    monkeypatch.setattr(
-        client_mod, "get_context", lambda: {
-            "trace_id": "t123",
-            "trace_source": "GAPI:GET/health",
-            "request_id": "r456",
-            "request_source": "GAPI:GET/health",
-            "extra": "should_not_be_sent",
-        }
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200)
+
+    base_url = "http://example.com"
+    monkeypatch.setattr(client_mod, "_CLIENTS", {
+        client_mod._client_key(base_url, 30.0): httpx.AsyncClient(
+            base_url=base_url,
+            transport=httpx.MockTransport(handler),
+            event_hooks={"request": [client_mod._inject_context_headers]},
+        )
+    })
+    yield requests
+
+
+def _client():
+    from shared.http import client as client_mod
+
+    return client_mod.ContextPropagatingClient("http://example.com")
+
+
+@pytest.mark.asyncio
+async def test_request_carries_context_headers(sent, use_context):
+    use_context(
+        trace_id="t123",
+        trace_source="GAPI:GET/health",
+        request_id="r456",
+        request_source="GAPI:GET/health",
     )
 
-    c = client_mod.ContextPropagatingClient("http://example.com")
-    headers = c._add_context_headers()
+    await _client().get("/x")
 
+    headers = sent[0].headers
     assert headers["X-Trace-Id"] == "t123"
     assert headers["X-Trace-Source"] == "GAPI:GET/health"
     assert headers["X-Request-Id"] == "r456"
     assert headers["X-Request-Source"] == "GAPI:GET/health"
-    assert "extra" not in headers
+    assert "X-Span-Source" not in headers
+
+
+@pytest.mark.asyncio
+async def test_request_context_overrides_caller_trace_headers(sent, use_context):
+    use_context()
+
+    await _client().post("/x", headers={"User-Agent": "pytest", "x-request-id": "caller"})
+
+    headers = sent[0].headers
+    assert headers["User-Agent"] == "pytest"
+    assert headers.get_list("X-Request-Id") == ["r1"]
+    assert headers["X-Trace-Id"] == "t1"
+
+
+@pytest.mark.asyncio
+async def test_request_skips_missing_values(sent, use_context):
+    use_context(request_id=None)
+
+    await _client().get("/x")
+
+    assert "X-Request-Id" not in sent[0].headers
+    assert sent[0].headers["X-Trace-Id"] == "t1"
 
 
-def test_add_context_headers_preserves_existing(monkeypatch):
+@pytest.mark.asyncio
+async def test_request_without_context_adds_nothing(sent):
+    await _client().get("/x")
+
+    assert not any(name.lower().startswith("x-") for name in sent[0].headers)
+
+
+@pytest.mark.asyncio
+async def test_clients_share_pool_per_base_url(monkeypatch):
     from shared.http import client as client_mod
 
-    class DummyAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
+    monkeypatch.setattr(client_mod, "_CLIENTS", {})
 
-    monkeypatch.setattr(client_mod.httpx, "AsyncClient", DummyAsyncClient)
-    monkeypatch.setattr(client_mod, "get_context", lambda: {
-        "trace_id": "t1",
-        "trace_source": "SVC:GET/x",
-        "request_id": "r1",
-        "request_source": "SVC:GET/x",
-    })
+    a = client_mod.ContextPropagatingClient("http://example.com")
+    b = client_mod.ContextPropagatingClient("http://example.com")
+    other = client_mod.ContextPropagatingClient("http://other.example.com")
+
+    assert a.client is b.client
+    assert a.client is not other.client
 
-    c = client_mod.ContextPropagatingClient("http://example.com")
-    headers = {"User-Agent": "pytest", "X-Custom": "1"}
-    out = c._add_context_headers(headers)
+    with pytest.warns(DeprecationWarning):
+        await a.close()
+    assert not b.client.is_closed
 
-    # Existing preserved and new added
-    assert out["User-Agent"] == "pytest"
-    assert out["X-Custom"] == "1"
-    assert out["X-Trace-Id"] == "t1"
+    await client_mod.shutdown_clients()
+    assert a.client.is_closed and other.client.is_closed
+    assert client_mod._CLIENTS == {}
 
 
-def test_add_context_headers_skips_missing_values(monkeypatch):
+def test_clients_are_not_shared_across_event_loops(monkeypatch):
+    import asyncio
     from shared.http import client as client_mod
 
-    class DummyAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
+    monkeypatch.setattr(client_mod, "_CLIENTS", {})
 
-    monkeypatch.setattr(client_mod.httpx, "AsyncClient", DummyAsyncClient)
-    monkeypatch.setattr(client_mod, "get_context", lambda: {
-        "trace_id": "t1",
-        "trace_source": "SVC:GET/x",
-        "request_id": None,  # Should be skipped
-        "request_source": "SVC:GET/x",
-    })
+    async def make_and_close():
+        c = client_mod.ContextPropagatingClient("http://example.com")
+        await client_mod.shutdown_clients()
+        return c.client
+
+    first = asyncio.run(make_and_close())
+    second = asyncio.run(make_and_close())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+    assert client_mod._CLIENTS == {}
+
+
+def test_clients_of_closed_loops_are_dropped(monkeypatch):
+    import asyncio
+    from shared.http import client as client_mod
+
+    monkeypatch.setattr(client_mod, "_CLIENTS", {})
+
+    async def make():
+        return client_mod.ContextPropagatingClient("http://example.com").client
+
+    # The first loop closes without shutdown_clients(); its client must not linger
+    first = asyncio.run(make())
+    second_loop = asyncio.new_event_loop()
+    try:
+        second = second_loop.run_until_complete(make())
+        assert list(client_mod._CLIENTS.values()) == [second]
+        assert first is not second
+
+        second_loop.run_until_complete(client_mod.shutdown_clients())
+    finally:
+        second_loop.close()
+    assert client_mod._CLIENTS == {}
+
+
+@pytest.mark.asyncio
+async def test_shutdown_clients_clears_clients_of_every_loop(monkeypatch):
+    import asyncio
+    from shared.http import client as client_mod
+
+    monkeypatch.setattr(client_mod, "_CLIENTS", {})
+
+    other_loop = asyncio.new_event_loop()
+    other_loop.close()
+    stale = httpx.AsyncClient()
+    client_mod._CLIENTS[(other_loop, "http://old.example.com", 30.0)] = stale
+    current = client_mod.ContextPropagatingClient("http://example.com").client
 
-    c = client_mod.ContextPropagatingClient("http://example.com")
-    out = c._add_context_headers()
+    await client_mod.shutdown_clients()
 
-    assert "X-Request-Id" not in out
-    assert out["X-Trace-Id"] == "t1"
+    assert current.is_closed
+    assert client_mod._CLIENTS == {}
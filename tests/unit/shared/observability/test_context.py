@@ -4,6 +4,7 @@ from shared.observability.context import (
     RequestContext,
     generate_trace_id,
     generate_request_id,
+    generate_trace_and_request_ids,
     is_valid_trace_id,
     is_valid_request_id,
     TRACE_ID_PATTERN,
@@ -29,6 +30,16 @@ def test_generate_request_id_format():
     assert REQUEST_ID_PATTERN.match(request_id)
 
 
+def test_generate_trace_and_request_ids_share_timestamp():
+    """Test that the paired generator returns valid ids with one timestamp."""
+    trace_id, request_id = generate_trace_and_request_ids()
+
+    assert is_valid_trace_id(trace_id)
+    assert is_valid_request_id(request_id)
+    assert trace_id[1:11] == request_id[1:11]
+    assert trace_id[11:] != request_id[11:]
+
+
 def test_generate_trace_id_contains_timestamp():
     """Test that trace_id contains current timestamp."""
     before = int(time.time())
@@ -102,6 +113,7 @@ def test_is_valid_trace_id_invalid():
     assert not is_valid_trace_id('trace-123')
     assert not is_valid_trace_id('t173522880')
     assert not is_valid_trace_id('t1735228800a1b2c3d4e5f6g')
+    assert not is_valid_trace_id('t1735228800a1b2c3d4e5f6\n')
 
 
 def test_is_valid_request_id_valid():
@@ -119,6 +131,29 @@ def test_is_valid_request_id_invalid():
     assert not is_valid_request_id('request-123')
     assert not is_valid_request_id('r173522880')
     assert not is_valid_request_id('r1735228800f6e5d4c3b2a1g')
+    assert not is_valid_request_id('r1735228800f6e5d4c3b2a1\n')
+
+
+def test_id_validation_agrees_with_patterns():
+    """Test that the structural checks accept exactly what the patterns accept."""
+    candidates = [
+        't1735228800a1b2c3d4e5f6',
+        'r1735228800f6e5d4c3b2a1',
+        't1735228800A1B2C3D4E5F6',
+        't173522880xa1b2c3d4e5f6',
+        'r1735228800f6e5d4c3b2ag',
+        'x1735228800a1b2c3d4e5f6',
+        '',
+    ]
+    for value in candidates:
+        assert is_valid_trace_id(value) == bool(TRACE_ID_PATTERN.match(value))
+        assert is_valid_request_id(value) == bool(REQUEST_ID_PATTERN.match(value))
+
+
+def test_id_validation_rejects_non_ascii_digits():
+    """Test that Unicode digits (accepted by regex \\d) are rejected."""
+    assert not is_valid_trace_id('t17352288\u06600a1b2c3d4e5f6')
+    assert not is_valid_request_id('r17352288\u06600f6e5d4c3b2a1')
 
 
 def test_request_context_creation():
@@ -158,3 +193,104 @@ def test_request_context_to_dict():
         'span_source': 'GAPI:POST/api/orders'
     }
 
+
+
+def test_request_context_to_dict_returns_a_copy():
+    """Test that mutating to_dict() output leaves the context unchanged."""
+    ctx = RequestContext(
+        trace_id='t1735228800a1b2c3d4e5f6',
+        trace_source='GAPI:/api/orders',
+        request_id='r1735228800f6e5d4c3b2a1',
+        request_source='GAPI:/api/orders',
+        span_source='GAPI:POST/api/orders'
+    )
+
+    ctx.to_dict()['trace_id'] = 'changed'
+
+    assert ctx.to_dict()['trace_id'] == 't1735228800a1b2c3d4e5f6'
+    assert not hasattr(ctx, '__dict__')
+
+
+def test_random_hex_pool_refills_across_block_boundary():
+    """Test that the hex pool serves full-length, distinct values past its buffer."""
+    from shared.observability.context import _RandomHexPool
+
+    pool = _RandomHexPool(block_size=16)
+    values = [pool.take(6) for _ in range(10)]
+
+    assert all(len(v) == 12 for v in values)
+    assert all(c in '0123456789abcdef' for v in values for c in v)
+    assert len(set(values)) == len(values)
+
+
+def test_random_hex_pool_never_hands_threads_the_same_bytes():
+    """Test that concurrent threads drawing from one hex pool get distinct values."""
+    from concurrent.futures import ThreadPoolExecutor
+    from shared.observability.context import _RandomHexPool
+
+    pool = _RandomHexPool(block_size=64)
+
+    def draw(_):
+        return [pool.take(6) for _ in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = [v for batch in executor.map(draw, range(8)) for v in batch]
+
+    assert len(set(values)) == len(values)
+
+
+def test_get_context_raw_headers_are_built_once_per_context():
+    """Test that propagation headers are pre-encoded and cached per RequestContext."""
+    from shared.observability.context import (
+        get_context_raw_headers,
+        set_current_context,
+        reset_current_context,
+    )
+
+    assert get_context_raw_headers() == ()
+
+    ctx = RequestContext(
+        trace_id='t1735228800a1b2c3d4e5f6',
+        trace_source='GAPI:POST/api/orders',
+        request_id='r1735228800f6e5d4c3b2a1',
+        request_source='GAPI:POST/api/orders',
+        span_source='GAPI:POST/api/orders'
+    )
+    token = set_current_context(ctx)
+    try:
+        raw = get_context_raw_headers()
+        assert raw == (
+            (b'x-trace-id', (b'X-Trace-Id', b't1735228800a1b2c3d4e5f6')),
+            (b'x-trace-source', (b'X-Trace-Source', b'GAPI:POST/api/orders')),
+            (b'x-request-id', (b'X-Request-Id', b'r1735228800f6e5d4c3b2a1')),
+            (b'x-request-source', (b'X-Request-Source', b'GAPI:POST/api/orders')),
+        )
+        assert get_context_raw_headers() is raw
+    finally:
+        reset_current_context(token)
+
+    assert get_context_raw_headers() == ()
+
+
+def test_get_context_raw_headers_rejects_non_ascii_values():
+    """Test that non-ASCII sources fail at encode time instead of being sent."""
+    import pytest
+    from shared.observability.context import (
+        get_context_raw_headers,
+        set_current_context,
+        reset_current_context,
+    )
+
+    ctx = RequestContext(
+        trace_id='t1735228800a1b2c3d4e5f6',
+        trace_source='EXTERNAL:POST/café',
+        request_id='r1735228800f6e5d4c3b2a1',
+        request_source='GAPI:POST/api/orders',
+        span_source='GAPI:POST/api/orders'
+    )
+    token = set_current_context(ctx)
+    try:
+        with pytest.raises(UnicodeEncodeError):
+            get_context_raw_headers()
+    finally:
+        reset_current_context(token)
@@ -1,67 +1,56 @@
 import json
+import re
 import logging
+import pytest
 from typing import Any, Dict
 
 from shared.observability.logger import get_logger, FORBIDDEN_KEYS
 from shared.observability.context import RequestContext
 
 
-class DummyHandler(logging.Handler):
-    """Capture log records for assertions."""
+@pytest.fixture
+def lines(monkeypatch) -> list[dict]:
+    """Capture emitted log lines as parsed JSON payloads."""
+    from shared.observability import logger as logger_mod
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.records: list[logging.LogRecord] = []
+    captured: list[dict] = []
+    monkeypatch.setattr(logger_mod, "_write_line", lambda line: captured.append(json.loads(line)))
+    return captured
 
-    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - trivial
-        self.records.append(record)
 
-
-def _make_logger(service_name: str = "test-service") -> tuple[Any, DummyHandler]:
-    """Create a logger instance with a dummy handler attached."""
-    logger = get_logger(service_name)
-
-    # Remove any existing handlers and attach dummy
-    logger.logger.handlers = []
-    handler = DummyHandler()
-    logger.logger.addHandler(handler)
-
-    return logger, handler
-
-
-def test_logger_wraps_kwargs_in_data_envelope():
-    logger, handler = _make_logger()
+def test_logger_wraps_kwargs_in_data_envelope(lines):
+    logger = get_logger("test-service")
 
     logger.info("Test message", extra_field="value", count=1)
 
-    assert len(handler.records) == 1
-    payload = json.loads(handler.records[0].getMessage())
+    assert len(lines) == 1
+    payload = lines[0]
 
     assert payload["message"] == "Test message"
     assert "data" in payload
     assert payload["data"] == {"extra_field": "value", "count": 1}
 
 
-def test_logger_merges_explicit_data_and_kwargs():
-    logger, handler = _make_logger()
+def test_logger_merges_explicit_data_and_kwargs(lines):
+    logger = get_logger("test-service")
 
     logger.info("With data", data={"a": 1}, b=2)
 
-    payload = json.loads(handler.records[0].getMessage())
+    payload = lines[0]
     assert payload["data"] == {"a": 1, "b": 2}
 
 
-def test_logger_keeps_non_dict_data_under_value_key():
-    logger, handler = _make_logger()
+def test_logger_keeps_non_dict_data_under_value_key(lines):
+    logger = get_logger("test-service")
 
     logger.info("Non-dict data", data=[1, 2, 3])
 
-    payload = json.loads(handler.records[0].getMessage())
+    payload = lines[0]
     assert payload["data"] == {"value": [1, 2, 3]}
 
 
-def test_logger_includes_context_fields_top_level():
-    logger, handler = _make_logger()
+def test_logger_includes_context_fields_top_level(lines):
+    logger = get_logger("test-service")
 
     ctx = RequestContext(
         trace_id="t123",
@@ -73,7 +62,7 @@ def test_logger_includes_context_fields_top_level():
 
     logger.info("With context", ctx, data={"x": 1})
 
-    payload = json.loads(handler.records[0].getMessage())
+    payload = lines[0]
 
     # Context fields are top-level
     assert payload["trace_id"] == "t123"
@@ -82,8 +71,8 @@ def test_logger_includes_context_fields_top_level():
     assert payload["data"] == {"x": 1}
 
 
-def test_logger_allows_structured_top_level_overrides():
-    logger, handler = _make_logger()
+def test_logger_allows_structured_top_level_overrides(lines):
+    logger = get_logger("test-service")
 
     ctx = RequestContext(
         trace_id="t-ctx",
@@ -95,20 +84,20 @@ def test_logger_allows_structured_top_level_overrides():
 
     logger.info("Override", ctx, trace_id="t-override", order_id="ord_1")
 
-    payload = json.loads(handler.records[0].getMessage())
+    payload = lines[0]
     assert payload["trace_id"] == "t-override"
     assert payload["order_id"] == "ord_1"
 
 
-def test_logger_filters_forbidden_top_level_keys():
-    logger, handler = _make_logger()
+def test_logger_filters_forbidden_top_level_keys(lines):
+    logger = get_logger("test-service")
 
     kwargs: Dict[str, Any] = {key: "SECRET" for key in FORBIDDEN_KEYS}
     kwargs["safe"] = "ok"
 
     logger.info("Secrets", **kwargs)
 
-    payload = json.loads(handler.records[0].getMessage())
+    payload = lines[0]
 
     # No forbidden key should appear anywhere at top level or inside data
     for forbidden in FORBIDDEN_KEYS:
@@ -118,3 +107,120 @@ def test_logger_filters_forbidden_top_level_keys():
 
     assert payload["data"] == {"safe": "ok"}
 
+
+def test_logger_filters_forbidden_keys_case_insensitively(lines):
+    logger = get_logger("test-service")
+
+    logger.info("Secrets", Authorization="Bearer x", PASSWORD="p", author="kept")
+
+    payload = lines[0]
+    assert payload["data"] == {"author": "kept"}
+
+
+def test_logger_timestamp_is_utc_iso_with_millis(lines):
+    logger = get_logger("test-service")
+
+    logger.info("Timestamp")
+
+    payload = lines[0]
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z", payload["timestamp"])
+
+
+def test_utc_timestamp_is_reused_within_a_millisecond(monkeypatch):
+    from shared.observability import logger as logger_mod
+
+    monkeypatch.setattr(logger_mod.time, "time_ns", lambda: 1_735_228_800_123_456_789)
+    first = logger_mod._utc_timestamp()
+
+    assert first == "2024-12-26T16:00:00.123Z"
+    assert logger_mod._utc_timestamp() is first
+
+
+def test_logger_skips_formatting_for_disabled_levels(monkeypatch, lines):
+    from shared.observability import logger as logger_mod
+
+    logger = get_logger("test-service", level=logging.INFO)
+
+    def fail():
+        raise AssertionError("disabled log call should not be formatted")
+
+    monkeypatch.setattr(logger_mod, "_utc_timestamp", fail)
+    logger.debug("Dropped", data={"x": 1})
+
+    assert lines == []
+
+
+def test_logger_falls_back_to_json_without_orjson(monkeypatch):
+    from shared.observability import logger as logger_mod
+
+    raw: list[bytes] = []
+    monkeypatch.setattr(logger_mod, "_write_line", raw.append)
+    monkeypatch.setattr(logger_mod, "ORJSON_AVAILABLE", False)
+    logger = get_logger("test-service")
+
+    logger.info("Fallback", data={"a": 1})
+
+    line = raw[0]
+    assert json.loads(line)["data"] == {"a": 1}
+    assert b", " not in line
+
+
+def test_write_line_appends_newline_to_stdout(capsys):
+    from shared.observability import logger as logger_mod
+
+    logger_mod._write_line(b'{"a":1}')
+
+    assert capsys.readouterr().out == '{"a":1}\n'
+
+
+def test_log_writer_batches_lines_in_order(monkeypatch):
+    from shared.observability import logger as logger_mod
+
+    writes: list[str] = []
+    monkeypatch.setattr(logger_mod, "_write_text", writes.append)
+    writer = logger_mod._LogWriter(max_batch_bytes=16)
+    for i in range(50):
+        writer.put("line-%02d\n" % i)
+    writer.start()
+    writer.stop(timeout=5)
+
+    assert "".join(writes) == "".join("line-%02d\n" % i for i in range(50))
+    # Batches never exceed max_batch_bytes (two 8-byte lines each)
+    assert all(len(chunk) <= 16 for chunk in writes)
+    assert len(writes) == 25
+
+
+def test_log_writer_reports_dropped_lines(monkeypatch):
+    from shared.observability import logger as logger_mod
+
+    writes: list[str] = []
+    monkeypatch.setattr(logger_mod, "_write_text", writes.append)
+    writer = logger_mod._LogWriter(max_pending=2)
+    # Not started yet, so nothing drains the queue
+    for line in ("a\n", "b\n", "c\n"):
+        writer.put(line)
+    writer.start()
+    writer.stop(timeout=5)
+
+    assert writer.dropped == 1
+    assert writes[0] == "a\nb\n"
+    warning = json.loads(writes[1])
+    assert warning["level"] == "WARNING"
+    assert warning["message"] == "Dropped log lines"
+    assert warning["data"] == {"dropped": 1, "total_dropped": 1}
+
+
+def test_start_log_writer_queues_until_stopped(capsys):
+    from shared.observability import logger as logger_mod
+
+    logger_mod.start_log_writer()
+    try:
+        logger_mod.start_log_writer()  # Idempotent: still one writer
+        writer = logger_mod._writer
+        get_logger("test-service").info("Queued")
+    finally:
+        logger_mod.stop_log_writer()
+
+    assert not writer._thread.is_alive()
+    assert logger_mod._writer is None
+    assert json.loads(capsys.readouterr().out)["message"] == "Queued"
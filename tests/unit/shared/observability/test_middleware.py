@@ -0,0 +1,197 @@
+"""Unit tests for ContextMiddleware."""
+import pytest
+from shared.observability.context import (
+    RequestContext,
+    get_context_obj,
+    get_context_raw_headers,
+    is_valid_trace_id,
+    is_valid_request_id,
+    reset_current_context,
+    set_current_context,
+)
+from shared.observability.middleware import ContextMiddleware
+
+
+def _scope(path="/api/orders", method="POST", headers=None):
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+
+
+def _middleware(app, **kwargs):
+    return ContextMiddleware(app, service_name="pulse", **kwargs)
+
+
+async def _call(scope, **kwargs):
+    seen = {}
+    sent = []
+
+    async def app(scope, receive, send):
+        seen["ctx"] = get_context_obj()
+        seen["scope_ctx"] = scope["state"]["context"]
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await _middleware(app, **kwargs)(scope, receive, send)
+    return seen, sent
+
+
+@pytest.mark.asyncio
+async def test_generates_context_when_headers_missing():
+    """Test that ids are generated and sources built from the service and route."""
+    seen, sent = await _call(_scope())
+
+    ctx = seen["ctx"]
+    assert ctx is seen["scope_ctx"]
+    assert is_valid_trace_id(ctx.trace_id)
+    assert is_valid_request_id(ctx.request_id)
+    assert ctx.trace_source == "PULSE:POST/api/orders"
+    assert ctx.request_source == "PULSE:POST/api/orders"
+    assert ctx.span_source == "PULSE:POST/api/orders"
+
+    # Context is reset after the request
+    assert get_context_obj() is None
+
+    response_headers = dict(sent[0]["headers"])
+    assert response_headers[b"x-trace-id"] == ctx.trace_id.encode()
+    assert response_headers[b"x-request-id"] == ctx.request_id.encode()
+    assert response_headers[b"content-type"] == b"application/json"
+
+
+@pytest.mark.asyncio
+async def test_uses_incoming_tracing_headers():
+    """Test that upstream headers are honoured and span_source is chained."""
+    seen, sent = await _call(_scope(headers={
+        "X-Trace-Id": "t1735228800a1b2c3d4e5f6",
+        "X-Request-Id": "r1735228800f6e5d4c3b2a1",
+        "X-Trace-Source": "GAPI:POST/api/orders",
+        "X-Request-Source": "GAPI:POST/api/orders",
+    }, path="/internal/orders"))
+
+    ctx = seen["ctx"]
+    assert ctx.trace_id == "t1735228800a1b2c3d4e5f6"
+    assert ctx.request_id == "r1735228800f6e5d4c3b2a1"
+    assert ctx.trace_source == "GAPI:POST/api/orders"
+    assert ctx.request_source == "PULSE:POST/internal/orders"
+    assert ctx.span_source == "GAPI:POST/api/orders->PULSE:POST/internal/orders"
+
+    response_headers = dict(sent[0]["headers"])
+    assert response_headers[b"x-trace-id"] == b"t1735228800a1b2c3d4e5f6"
+    assert response_headers[b"x-request-id"] == b"r1735228800f6e5d4c3b2a1"
+
+
+@pytest.mark.asyncio
+async def test_incoming_ids_skip_id_generation(monkeypatch):
+    """Test that a request carrying both ids never generates new ones."""
+    from shared.observability import middleware as middleware_mod
+
+    def fail():
+        raise AssertionError("ids should not be generated")
+
+    for name in ("generate_trace_id", "generate_request_id", "generate_trace_and_request_ids"):
+        monkeypatch.setattr(middleware_mod, name, fail)
+
+    seen, _ = await _call(_scope(headers={
+        "X-Trace-Id": "t1735228800a1b2c3d4e5f6",
+        "X-Request-Id": "r1735228800f6e5d4c3b2a1",
+    }))
+
+    assert seen["ctx"].trace_id == "t1735228800a1b2c3d4e5f6"
+
+
+@pytest.mark.asyncio
+async def test_generates_only_the_missing_id():
+    """Test that a supplied trace id is kept when only the request id is generated."""
+    seen, sent = await _call(_scope(headers={"X-Trace-Id": "t1735228800a1b2c3d4e5f6"}))
+
+    ctx = seen["ctx"]
+    assert ctx.trace_id == "t1735228800a1b2c3d4e5f6"
+    assert is_valid_request_id(ctx.request_id)
+    assert dict(sent[0]["headers"])[b"x-request-id"] == ctx.request_id.encode()
+
+
+@pytest.mark.asyncio
+async def test_first_value_of_repeated_header_wins():
+    """Test that a repeated tracing header resolves like Headers.get()."""
+    scope = _scope()
+    scope["headers"] = [
+        (b"x-trace-id", b"t1735228800a1b2c3d4e5f6"),
+        (b"x-trace-id", b"t1735228800ffffffffffff"),
+    ]
+
+    seen, _ = await _call(scope)
+
+    assert seen["ctx"].trace_id == "t1735228800a1b2c3d4e5f6"
+
+
+@pytest.mark.asyncio
+async def test_propagated_headers_carry_origin_to_next_hop():
+    """Test that headers propagated from a GAPI context rebuild it correctly in Pulse."""
+    gapi_ctx = RequestContext(
+        trace_id="t1735228800a1b2c3d4e5f6",
+        trace_source="GAPI:POST/api/orders",
+        request_id="r1735228800f6e5d4c3b2a1",
+        request_source="GAPI:POST/api/orders",
+        span_source="GAPI:POST/api/orders"
+    )
+    token = set_current_context(gapi_ctx)
+    try:
+        raw_headers = get_context_raw_headers()
+    finally:
+        reset_current_context(token)
+    scope = _scope(path="/internal/orders")
+    scope["headers"] = [(name, value) for name, (_, value) in raw_headers]
+
+    seen, _ = await _call(scope)
+
+    # trace_source is the origin; request_source is per hop
+    ctx = seen["ctx"]
+    assert ctx.trace_id == gapi_ctx.trace_id
+    assert ctx.request_id == gapi_ctx.request_id
+    assert ctx.trace_source == "GAPI:POST/api/orders"
+    assert ctx.request_source == "PULSE:POST/internal/orders"
+    assert ctx.span_source == "GAPI:POST/api/orders->PULSE:POST/internal/orders"
+
+
+@pytest.mark.asyncio
+async def test_bypass_paths_skip_context():
+    """Test that bypassed paths reach the app without context or tracing headers."""
+    seen = {}
+    sent = []
+
+    async def app(scope, receive, send):
+        seen["ctx"] = get_context_obj()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = _middleware(app, bypass_paths={"/metrics"})
+    await middleware(_scope(path="/metrics", method="GET"), None, send)
+
+    assert seen["ctx"] is None
+    assert sent[0]["headers"] == []
+
+
+@pytest.mark.asyncio
+async def test_non_http_scope_passes_through():
+    """Test that non-HTTP scopes are forwarded untouched."""
+    called = []
+
+    async def app(scope, receive, send):
+        called.append(scope)
+
+    scope = {"type": "lifespan"}
+    await _middleware(app)(scope, None, None)
+
+    assert called == [scope]
+    assert "state" not in scope
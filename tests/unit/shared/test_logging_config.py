@@ -0,0 +1,17 @@
+"""Unit tests for the Uvicorn JSON log formatter"""
+
+import json
+import logging
+
+from config.logging_config import JSONFormatter
+
+
+def test_json_formatter_timestamp_uses_record_time():
+    record = logging.LogRecord("uvicorn", logging.INFO, __file__, 1, "Started", None, None)
+    record.created = 1_735_228_800.123456
+
+    payload = json.loads(JSONFormatter().format(record))
+
+    assert payload["timestamp"] == "2024-12-26T16:00:00.123456Z"
+    assert payload["level"] == "INFO"
+    assert payload["message"] == "Started"
@@ -3,6 +3,9 @@
 import os
 from contextlib import contextmanager
 
+import pytest
+from pydantic import ValidationError
+
 from config.settings import Settings, get_settings
 
 
@@ -115,3 +118,27 @@ def test_missing_required_values_fail_fast():
             raised = True
     assert raised is True, "Settings() should raise when required DB values are missing"
 
+
+def test_get_settings_returns_cached_immutable_instance():
+    """get_settings() is a cached singleton, so the instance must be read-only."""
+    with temp_env(
+        ENVIRONMENT="local",
+        APP_HOST="0.0.0.0",
+        APP_PORT="8000",
+        LOG_LEVEL="INFO",
+        TRACING_ENABLED="false",
+        PULSE_DB_HOST="localhost",
+        PULSE_DB_PORT="5432",
+        PULSE_DB_USER="pulse",
+        PULSE_DB_PASSWORD="secret",
+        PULSE_DB_NAME="pulse",
+    ):
+        settings = get_settings()
+        assert get_settings() is settings
+
+        with pytest.raises(ValidationError):
+            settings.log_level = "DEBUG"
+        assert settings.log_level == "INFO"
+
+    # temp_env cleared the cache, so later tests never see this instance
+    assert get_settings.cache_info().currsize == 0